@@ -5,6 +5,8 @@ from .settings_window import SettingsWindow
 from .drag_drop_widget import DragDropWidget
 from .progress_bar import ProgressWidget
 from .result_viewer import ResultsViewerWidget
+from .tif_render_worker import TifRenderWorker
+from .file_export_worker import FileExportWorker
 
 # Package metadata
 __version__ = '0.1.0'
@@ -19,5 +21,7 @@ __all__ = [
     "SettingsWindow",
     "DragDropWidget",
     "ProgressWidget",
-    "ResultViewerWidget"
+    "ResultViewerWidget",
+    "TifRenderWorker",
+    "FileExportWorker"
 ]
\ No newline at end of file
@@ -0,0 +1,156 @@
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot
+import os
+import sys
+import shutil
+
+
+
+"""
+
+  Desc: This Class Is Utilized To Export (Copy) A Result File In A
+  Separate Thread To Keep The Results Viewer Responsive While Large
+  Orthomosaics Or Point Clouds Are Copied. The File Is Copied In
+  Chunks So Progress Can Be Reported, Using The Kernel's Zero-Copy
+  os.sendfile On Linux And A Single Reused Buffer Elsewhere. The
+  Source's Metadata Is Preserved Once The Contents Are Copied.
+
+
+"""
+class FileExportWorker(QThread):
+
+  # Define Signals For Communicating With Our Main Thread (Bytes Copied So Far / Destination / Error)
+  bytes_copied = pyqtSignal('qint64')
+  export_completed = pyqtSignal(str)
+  export_failed = pyqtSignal(str)
+
+  # Amount Copied Between Progress Updates
+  chunk_size = 8 * 1024 * 1024
+
+
+  """
+
+    Desc: Initializes Our Export Worker With The File To Copy And Where
+    To Copy It To.
+
+    Preconditions:
+      1. source_path Is A Valid Path To A Readable File
+      2. dest_path Is A Path In A Writable Directory
+
+    Postconditions:
+      1. Initialize Our Worker Thread
+      2. Store Our Source And Destination Paths
+      3. Set Is Canceled Flag To False
+
+  """
+  def __init__(self, source_path, dest_path, parent=None):
+    super().__init__(parent)
+    self.source_path = source_path
+    self.dest_path = dest_path
+    self.total_bytes = 0
+    self.is_canceled = False
+
+
+  """
+
+    Desc: Run Method Delegated To Our Worker Thread. Copies The Source
+    File's Contents To The Destination In Chunks, Emitting bytes_copied
+    After Each One, Then Copies Over The Source's Metadata. A Canceled
+    Export Removes The Partially Written Destination File.
+
+    Preconditions:
+      1. Worker Was Initialized With Valid Paths
+
+    Postconditions:
+      1. Emit export_completed With The Destination Path On Success
+      2. Emit export_failed With The Error Message On Failure
+      3. Nothing Is Emitted If The Worker Was Canceled
+
+  """
+  @pyqtSlot()
+  def run(self):
+    try:
+      # Opening The Destination Would Truncate The Source If They're The Same File
+      if os.path.exists(self.dest_path) and os.path.samefile(self.source_path, self.dest_path):
+        raise shutil.SameFileError(f"{self.source_path} and {self.dest_path} are the same file")
+
+      self.total_bytes = os.path.getsize(self.source_path)
+      with open(self.source_path, 'rb') as src, open(self.dest_path, 'wb') as dst:
+        if sys.platform.startswith('linux'):
+          self._copy_sendfile(src, dst)
+        else:
+          self._copy_buffered(src, dst)
+
+      # Clean Up Our Partial Copy If The User Canceled
+      if self.is_canceled:
+        os.remove(self.dest_path)
+        return
+
+      shutil.copystat(self.source_path, self.dest_path)
+      self.export_completed.emit(str(self.dest_path))
+    except Exception as e:
+      if not self.is_canceled:
+        self.export_failed.emit(str(e))
+
+
+  """
+
+    Desc: This Method Is Used To Cancel The Export. The Copy Stops After
+    The Current Chunk And The Partial Destination File Is Removed.
+
+    Preconditions:
+      1. None
+
+    Postconditions:
+      1. Set Is Canceled Flag To True
+
+  """
+  def cancel(self):
+    self.is_canceled = True
+
+
+  """
+
+    Desc: Function Will Copy The File Through os.sendfile, Which Moves The
+    Data Kernel-Side Without Passing It Through Python Buffers.
+
+    Preconditions:
+      1. src Is Open For Binary Reading, dst For Binary Writing
+      2. Running On Linux (sendfile Between Regular Files)
+
+    Postconditions:
+      1. The Source's Contents Are Written To dst (Unless Canceled)
+
+  """
+  def _copy_sendfile(self, src, dst):
+    copied = 0
+    while copied < self.total_bytes and not self.is_canceled:
+      sent = os.sendfile(dst.fileno(), src.fileno(), copied, self.chunk_size)
+      if sent == 0:
+        break
+      copied += sent
+      self.bytes_copied.emit(copied)
+
+
+  """
+
+    Desc: Function Will Copy The File Through A Single Reused Buffer,
+    For Platforms Where os.sendfile Can't Write To Regular Files.
+
+    Preconditions:
+      1. src Is Open For Binary Reading, dst For Binary Writing
+
+    Postconditions:
+      1. The Source's Contents Are Written To dst (Unless Canceled)
+
+  """
+  def _copy_buffered(self, src, dst):
+    buffer = bytearray(self.chunk_size)
+    view = memoryview(buffer)
+    copied = 0
+    while not self.is_canceled:
+      read = src.readinto(buffer)
+      if not read:
+        break
+      dst.write(view[:read])
+      copied += read
+      self.bytes_copied.emit(copied)
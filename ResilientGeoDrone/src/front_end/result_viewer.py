@@ -2,18 +2,13 @@ from pathlib import Path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
                              QPushButton, QLabel, QSplitter, QComboBox, QGroupBox, 
                              QStackedWidget, QScrollArea, QFileDialog, QMessageBox, QFrame, QSlider,
-                             QCheckBox)
-from PyQt5.QtCore import Qt, QSize, QEvent
-from PyQt5.QtGui import QPixmap, QImage
-import rasterio
+                             QCheckBox, QProgressDialog)
+from PyQt5.QtCore import Qt, QSize, QEvent, QTimer
+from PyQt5.QtGui import QPixmap, QImage, QPainter
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.colors import Normalize
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-from matplotlib.cm import ScalarMappable
-from matplotlib.colors import Normalize
-import cv2
+from .tif_render_worker import TifRenderWorker
+from .file_export_worker import FileExportWorker
 
 
 
@@ -62,6 +57,40 @@ class ResultsViewerWidget(QWidget):
       self.contour_line_count = 5
       self.current_colormap = 'viridis'
 
+      # Selectable Colormaps, Each Sampled Once Into A 256-Entry uint8 RGBA Lookup Table
+      self.available_colormaps = ['viridis', 'plasma', 'inferno', 'magma', 'terrain', 'rainbow']
+      self.cmap_luts = {name: (plt.get_cmap(name)(np.linspace(0, 1, 256)) * 255).astype(np.uint8)
+                        for name in self.available_colormaps}
+
+      # Cached Hillshade Intensity For The Current File ((Path, Shape), Intensity)
+      self.hillshade_cache = None
+
+      # Cached Contour Line Mask For The Current File ((Path, Shape, Line Count), Mask)
+      self.contour_cache = None
+
+      # Decoded Single-Band Data For The Current File, Reused For Colormap/Contour Re-Renders
+      self.current_tif = None
+
+      # Rendered Image Array Backing The Displayed Pixmap (Shared, Not Copied)
+      self.tif_buffer = None
+
+      # Scratch Buffers Recycled Across Renders (Handed To One Worker At A Time)
+      self.scratch_buffers = None
+
+      # Background Render Worker And Counter To Discard Superseded Renders
+      self.tif_worker = None
+      self.render_generation = 0
+
+      # Background Export Worker And Its Progress Dialog
+      self.export_worker = None
+      self.export_progress = None
+
+      # Single-Shot Timer To Coalesce Rapid Colormap Changes Into One Reload
+      self.reload_timer = QTimer(self)
+      self.reload_timer.setSingleShot(True)
+      self.reload_timer.setInterval(150)
+      self.reload_timer.timeout.connect(self._reload_current_tif)
+
       # Setup The UI Layout
       self._setup_ui()
 
@@ -95,15 +124,16 @@ class ResultsViewerWidget(QWidget):
     Postconditions:
       1. The Contour Line Count Will Be Updated Based On The Slider Value
       2. The Function Will Check If The Current File Path Is A Valid TIF File
-      3. If So, It Will Reload The TIF File With The New Contour Line Count
+      3. If So, It Will Re-Render The TIF File With The New Contour Line Count
+         (Only Re-Reading The File If The Resolution Changed)
   
   """
   def _apply_contour_changes(self):
       self.contour_line_count = self.contour_slider.value()
 
-      # Reload Our TIF File With The New Contour Line Count
+      # Re-Render Our TIF File With The New Contour Line Count (And Resolution)
       if self.current_file_path and self.current_file_path.suffix.lower() in ('.tiff', '.tif'):
-        self._load_tif_file(self.current_file_path)
+        self._render_current_tif()
       
       
   """
@@ -209,7 +239,7 @@ class ResultsViewerWidget(QWidget):
       # Colormap Selector (Only For TIFs)
       self.colormap_label = QLabel("Colormap:")
       self.colormap_selector = QComboBox()
-      self.colormap_selector.addItems(['viridis', 'plasma', 'inferno', 'magma', 'terrain', 'rainbow'])
+      self.colormap_selector.addItems(self.available_colormaps)
       self.colormap_selector.currentTextChanged.connect(self._on_colormap_changed)
       
       # Add Colormap Selector To Layout
@@ -280,7 +310,10 @@ class ResultsViewerWidget(QWidget):
       # Stacked Widget To Cycle File Type Viewers
       self.file_viewers = QStackedWidget()
       
-      # .tif File Viewer (Page 0)
+      # .tif File Viewer (Page 0), With Its Colorbar Alongside
+      tif_page = QWidget()
+      tif_layout = QHBoxLayout(tif_page)
+      tif_layout.setContentsMargins(0, 0, 0, 0)
       self.tif_viewer = QScrollArea()
       self.tif_viewer.setWidgetResizable(True)
       self.tif_viewer.setAlignment(Qt.AlignCenter)
@@ -290,7 +323,14 @@ class ResultsViewerWidget(QWidget):
 
       # Set Our Defaut Image To Nothing Currently
       self.tif_viewer.setWidget(self.tif_image)
-      self.file_viewers.addWidget(self.tif_viewer)
+      tif_layout.addWidget(self.tif_viewer, 1)
+
+      # Colorbar For Height Maps (Hidden For Multi-Band Images)
+      self.colorbar_label = QLabel(objectName="tifColorbar")
+      self.colorbar_label.setAlignment(Qt.AlignCenter)
+      self.colorbar_label.setVisible(False)
+      tif_layout.addWidget(self.colorbar_label)
+      self.file_viewers.addWidget(tif_page)
       
       # Empty State (page 1)
       self.empty_state = QLabel("Select a file from the list to view its contents")
@@ -440,7 +480,8 @@ class ResultsViewerWidget(QWidget):
     # Create An Image Label 
     image_label = QLabel()
     image_label.setAlignment(Qt.AlignCenter)
-    image_label.setPixmap(pixmap)
+    # Deep Copy, As Our Viewer's Pixmap Shares Its Render Buffer Which The Next Render Replaces
+    image_label.setPixmap(pixmap.copy())
     image_label.setScaledContents(False) # Disable Scaling
 
     # Create Scroll Area For Image
@@ -846,11 +887,11 @@ class ResultsViewerWidget(QWidget):
   
       Desc: Function Will Load A .tif File And Display It In The Viewer.
       It Will Apply Enhanced Terrain Visualization Techniques To The
-      Image, Including Hillshading And Colormap Application. The Function
-      Will Also Handle The Case Where The File Cannot Be Loaded Or Displayed,
-      And Will Provide An Error Message To The User. It Will Also Grab
-      Metadata Information From The File And Display It In The UI For Height
-      Maps.
+      Image, Including Hillshading And Colormap Application. The Decoding
+      And Rendering Run On A TifRenderWorker Thread So The UI Stays
+      Responsive; The Result Is Displayed Through self._on_tif_rendered(...)
+      Or self._on_tif_render_failed(...). It Will Also Grab Metadata
+      Information From The File And Display It In The UI For Height Maps.
 
       Preconditions:
           1. The File Path Provided Should Be A .tif File
@@ -867,149 +908,209 @@ class ResultsViewerWidget(QWidget):
   
   """
   def _load_tif_file(self, file_path):
-    try:
-      with rasterio.Env(GDAL_CACHEMAX=512):
-          with rasterio.open(str(file_path)) as src:
-              # Single Band Photo (e.g. DSM, DTM) Or Multi-Band (e.g. RGB)
-              if src.count == 1:
-                # If Single-Band, Read The Data
-                data = src.read(1)
-                # For Given NoData Value, Set To NaN For Visualization
-                if src.nodata is not None:
-                  data = np.where(data == src.nodata, np.nan, data)
-                
-                # Create Our Figure...
-                dpi = 15                                  # DPI Is Utilized For Content Scaling
-                height, width = data.shape                # Get The Height And Width Of The Image
-                
-                if height * width > 4000000:              # 4 Megapixels Threshold
-                  if self.auto_scaling:
-                    # Use Automatic Scaling Based On Image Size 
-                    scale_factor = np.sqrt(5000000 / (height * width))
-                  else:
-                    # Use User-Defined Scaling Factor
-                    scale_factor = self.scale_factor_override
-                      
-                  # Don't Scale Up If Scale Factor > 1
-                  if scale_factor < 1.0:
-                    new_height = int(height * scale_factor)
-                    new_width = int(width * scale_factor)
-                    
-                    # Use High-Quality Lanczos Resampling
-                    data = cv2.resize(data, (new_width, new_height), 
-                                    interpolation=cv2.INTER_LANCZOS4)
-                    
-                    # Apply Subtle Sharpening To Preserve Perceived Detail
-                    kernel = np.array([[-0.1, -0.1, -0.1],
-                                    [-0.1,  1.8, -0.1],
-                                    [-0.1, -0.1, -0.1]])
-                    data = cv2.filter2D(data, -1, kernel)
-                    
-                    # Update Dimensions
-                    height, width = data.shape
-                    dpi = int(dpi / scale_factor)  # Adjust DPI Based On Scaling
-                    
-
-                figsize = (width/dpi, height/dpi)          # Figure Size Will Depend On Our DPI And Image Size
-                fig = Figure(figsize=figsize, dpi=dpi)     # Setup Our Figures Size With Its Overall DPI
-
-                # Create Our Key Axes For The Figure
-                ax = fig.add_subplot(111)
-                
-                # Calculate Our Hillshade Filter For The Image
-                from matplotlib.colors import LightSource
-                ls = LightSource(azdeg=315, altdeg=35)
-                
-                # Compute Our Minimum And Maximum Values For The Data This Is Used For The Hillshade And Color Mapping
-                vmin, vmax = np.nanpercentile(data, [2, 98])
-                amin, amax = np.nanmin(data), np.nanmax(data)
-
-                # Apply Our Colormap And Hillshade To The Provided .tif Data
-                cmap = plt.get_cmap(self.current_colormap)
-                rgb = ls.shade(data, cmap=cmap, blend_mode='soft', 
-                            vmin=vmin, vmax=vmax, vert_exag=3)
-                
-                # Add Contour Lines On .tif Image To Help With Texturing (Optional To Avoid Cluttering In Small Images)
-                levels = np.linspace(amin, amax, self.contour_line_count)
-                contour = ax.contour(data, levels=levels, colors='black', 
-                                alpha=0.25, linewidths=0.4, linestyles='solid')
-
-                # Display Our RGB Formatted Image To User
-                ax.imshow(rgb)
-
-                # Get The Normalization Of The Data For The Colorbar
-                norm = Normalize(vmin=amin, vmax=amax)
-                sm = ScalarMappable(cmap=cmap, norm=norm)
-                sm.set_array([])
-
-                # Add Colorbar To The Figure
-                cbar = fig.colorbar(sm, ax=ax, shrink=0.9)
-                cbar.set_label(f'Elevation ({amin:.2f}m - {amax:.2f}m)', 
-                        fontsize=45, fontweight='bold', labelpad=12)
-                cbar.ax.tick_params(labelsize=40, width=3, length=15)       
-
-                # Hide Axes For Layout Currently
-                ax.axis('off')
-
-                # Set The Figures Layout To Pad 0 So We Don't Overlap But Aren't Far Away
-                fig.tight_layout(pad=0)
-                
-                # Render Our Figure And Convert To QImage For Display
-                canvas = FigureCanvasAgg(fig)
-                canvas.draw()
-                buf = canvas.buffer_rgba()
-
-                # Convert To A QImage For UI Displayment
-                qimg = QImage(buf, width, height, QImage.Format_RGBA8888)
-                pixmap = QPixmap.fromImage(qimg)
-
-                stats = {
-                      "Min elevation": f"{np.nanmin(data):.2f}m",
-                      "Max elevation": f"{np.nanmax(data):.2f}m",
-                      "Mean elevation": f"{np.nanmean(data):.2f}m",
-                      "Resolution": f"{src.res[0]:.2f}m/pixel"
-                }
-                # Format With Key: Value Pairs
-                stats_str = " | ".join([f"{k}: {v}" for k, v in stats.items()])
-                self.file_info.setText(f"{file_path.name} - {stats_str}")
-
-                  
-              else:
-                # Multi-Band Image (RGB) Will Simply Just Be Displayed Without Filter
-                rgb = np.zeros((src.height, src.width, 3), dtype=np.uint8)
-                
-                # Read All 3 Bands
-                for i in range(min(3, src.count)):
-                  band = src.read(i+1)
-                  
-                  # Normalize Our Bands Contents
-                  if np.any(band):
-                    min_val = np.percentile(band[band > 0], 2)
-                    max_val = np.percentile(band[band > 0], 98)
-                    if min_val == max_val:
-                      # Increment Through Our Buffer And Set Our Values For Each Entry
-                      rgb[:,:,i] = 0
-                    else:
-                      # Increment Through Our Buffer And Set Our Values For Each Entry
-                      rgb[:,:,i] = np.clip((band - min_val) * 255 / (max_val - min_val), 0, 255).astype(np.uint8)
-            
-                # Create A QImage With RGB Data And Then Pass It Into Pixmap For Display
-                qimg = QImage(rgb.data, rgb.shape[1], rgb.shape[0], rgb.shape[1] * 3, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qimg)
-                self.file_info.setText(f"{file_path.name} - Minimum Elevation: {min_val:.2f}m | Maximum Elevation: {max_val:.2f}m")
-            
-              # Update The Image Label With The Pixmap
-              self.tif_image.setPixmap(pixmap)
-              self.tif_image.setMinimumSize(QSize(1, 1))  # Allow Our Images Scaling
-              
-              # Set Our Current View To The .tif Viewer
-              self.file_viewers.setCurrentIndex(0)
-                
-      # Else If We Fail, Set To Empty State And Return To User A Traceback Error
-    except Exception as e:
-      self.file_viewers.setCurrentIndex(2)  # Empty state
-      self.empty_state.setText(f"Error loading TIF file: {str(e)}")
-  
+    # Forget Previously Decoded Data So The File Is Read Fresh
+    self.current_tif = None
+    self._start_tif_render(file_path)
+
+
+  """
+
+    Desc: Function Will Re-Render The Current .tif File With The Current
+    Colormap, Contour Line Count, And Resolution Settings. Decoded Data
+    From The Last Render Is Reused, So The File Is Only Reopened If The
+    Resolution Settings Changed Or The File Was Never Decoded (Multi-Band).
+
+    Preconditions:
+      1. self.current_file_path Is A Valid .tif File
+
+    Postconditions:
+      1. The .tif File Is Re-Rendered On A TifRenderWorker Thread
+
+  """
+  def _render_current_tif(self):
+    self._start_tif_render(self.current_file_path)
+
+
+  """
+
+    Desc: Function Will Start A TifRenderWorker For The Given .tif File
+    With A Snapshot Of Our Display Settings, Caches, And Decoded Data.
+    Our Scratch Buffers Are Handed Over To The Worker And Only Taken Back
+    Once It Finishes, So Two Workers Never Write To The Same Buffer. Any
+    In-Flight Render Is Superseded.
+
+    Preconditions:
+      1. file_path Is A Valid Path To A .tif File
+
+    Postconditions:
+      1. self.render_generation Is Incremented
+      2. Any Previous Worker Is Canceled
+      3. A New TifRenderWorker Is Started And Stored In self.tif_worker
+
+  """
+  def _start_tif_render(self, file_path):
+    # Supersede Any In-Flight Render (Its Results Will Be Ignored)
+    self.render_generation += 1
+    if self.tif_worker is not None:
+      self.tif_worker.cancel()
+
+    # Hand Off Decoding And Rendering To A Worker Thread
+    self.tif_worker = TifRenderWorker(self.render_generation, file_path, self.current_colormap,
+                                      self.contour_line_count, self.auto_scaling, self.scale_factor_override,
+                                      self.hillshade_cache, self.contour_cache,
+                                      cmap_lut=self.cmap_luts.get(self.current_colormap),
+                                      current_tif=self.current_tif, scratch=self.scratch_buffers, parent=self)
+    # The Worker Now Owns Our Scratch Buffers (A Superseded Worker May Still Be Writing To Its Own)
+    self.scratch_buffers = None
+    self.tif_worker.render_completed.connect(self._on_tif_rendered)
+    self.tif_worker.render_failed.connect(self._on_tif_render_failed)
+    self.tif_worker.finished.connect(self.tif_worker.deleteLater)
+    self.tif_worker.start()
+
+
+  """
+
+    Desc: Function Will Display A .tif Image Rendered By Our TifRenderWorker.
+    Results From Superseded Renders Are Ignored. The Worker's Hillshade And
+    Contour Caches, And Its Decoded Data, Are Kept So Later Renders Of The
+    Same File Can Reuse Them.
+
+    Preconditions:
+      1. Called From TifRenderWorker's render_completed Signal
+      2. image Is A (H, W, 3) RGB Or (H, W, 4) RGBA uint8 Array
+
+    Postconditions:
+      1. The .tif Image Is Displayed Through The UI
+      2. The .tif File Metadata Information As Well As Name Is Displayed
+      3. The File Viewer Is Set To The TIF Page
+
+  """
+  def _on_tif_rendered(self, generation, image, info):
+    if generation != self.render_generation:
+      return
+
+    # Keep The Worker's Caches And Decoded Data For The Next Render
+    self.hillshade_cache = self.tif_worker.hillshade_cache
+    self.contour_cache = self.tif_worker.contour_cache
+    self.current_tif = self.tif_worker.current_tif
+    self.scratch_buffers = self.tif_worker.scratch
+
+    # Height Maps Get A Colorbar Matching The Colormap They Were Rendered With
+    if self.current_tif is not None:
+      self._update_colorbar(self.tif_worker.cmap_lut, self.current_tif['amin'], self.current_tif['amax'])
+    else:
+      self.colorbar_label.setVisible(False)
+    self.tif_worker = None
+
+    # Convert To A QImage For UI Displayment
+    height, width, channels = image.shape
+    image_format = QImage.Format_RGBA8888 if channels == 4 else QImage.Format_RGB888
+    qimg = QImage(image.data, width, height, image.strides[0], image_format)
+
+    # Without Format Conversion The Pixmap Shares Our Array's Memory Instead Of Copying It,
+    # So The Array Must Stay Alive For As Long As The Pixmap Is Displayed
+    self.tif_buffer = image
+    pixmap = QPixmap.fromImage(qimg, Qt.NoFormatConversion)
+    self.file_info.setText(info)
+
+    # Update The Image Label With The Pixmap
+    self.tif_image.setPixmap(pixmap)
+    self.tif_image.setMinimumSize(QSize(1, 1))  # Allow Our Images Scaling
+
+    # Set Our Current View To The .tif Viewer
+    self.file_viewers.setCurrentIndex(0)
+
+
+  """
+
+    Desc: Function Will Draw A Vertical Colorbar For The Displayed Height
+    Map Into Our Colorbar Label. The Gradient Comes Straight From The
+    Colormap's Lookup Table And The Tick Labels Are Drawn With QPainter,
+    Which Is Far Cheaper Than Typesetting A Matplotlib Colorbar Per Render.
+
+    Preconditions:
+      1. lut Is A (256, 4) uint8 RGBA Colormap Lookup Table
+      2. amin And amax Are The Minimum And Maximum Elevation Of The Data
+
+    Postconditions:
+      1. The Colorbar Label Shows The Gradient With Elevation Ticks
+      2. The Colorbar Label Is Visible
+
+  """
+  def _update_colorbar(self, lut, amin, amax):
+    bar_width, tick_count, margin = 20, 6, 10
+    height = max(self.tif_viewer.viewport().height(), 200)
+    bar_height = height - 2 * margin
+
+    # Gradient With The Maximum At The Top
+    indices = np.linspace(255, 0, bar_height).astype(np.uint8)
+    colors = np.ascontiguousarray(np.repeat(lut[indices][:, np.newaxis, :], bar_width, axis=1))
+    gradient = QImage(colors.data, bar_width, bar_height, colors.strides[0], QImage.Format_RGBA8888)
+
+    # Draw Our Gradient, Ticks, And Elevation Labels
+    image = QImage(bar_width + 80, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.drawImage(0, margin, gradient)
+    painter.setPen(self.palette().windowText().color())
+    for i, value in enumerate(np.linspace(amax, amin, tick_count)):
+      y = margin + round(i * (bar_height - 1) / (tick_count - 1))
+      painter.drawLine(bar_width, y, bar_width + 4, y)
+      painter.drawText(bar_width + 7, y - 8, 73, 16, Qt.AlignLeft | Qt.AlignVCenter, f"{value:.2f}m")
+    painter.end()
+
+    self.colorbar_label.setPixmap(QPixmap.fromImage(image))
+    self.colorbar_label.setToolTip(f"Elevation ({amin:.2f}m - {amax:.2f}m)")
+    self.colorbar_label.setVisible(True)
+
+
+  """
+
+    Desc: Function Will Show An Error When Our TifRenderWorker Fails To
+    Load Or Render A .tif File. Errors From Superseded Renders Are Ignored.
+
+    Preconditions:
+      1. Called From TifRenderWorker's render_failed Signal
+
+    Postconditions:
+      1. The File Viewer Is Set To An Empty State With The Error Message
+
+  """
+  def _on_tif_render_failed(self, generation, message):
+    if generation != self.render_generation:
+      return
+
+    self.scratch_buffers = self.tif_worker.scratch
+    self.tif_worker = None
+    self.file_viewers.setCurrentIndex(2)  # Empty state
+    self.empty_state.setText(f"Error loading TIF file: {message}")
+
+
+  """
+
+    Desc: Function Will Make Sure Any In-Flight TIF Render Is Canceled And
+    Finished Before The Viewer Closes, So The Worker Thread Isn't Destroyed
+    While Still Running.
+
+    Preconditions:
+      1. event Is The QCloseEvent For The Viewer
+
+    Postconditions:
+      1. Any Running TifRenderWorker Is Canceled And Waited On
+      2. Any Running FileExportWorker Is Waited On
+      3. The Close Event Is Handled By The Parent Class
+
+  """
+  def closeEvent(self, event):
+    if self.tif_worker is not None:
+      self.tif_worker.cancel()
+      self.tif_worker.wait()
+      self.tif_worker = None
+    # Let A Running Export Finish Rather Than Leave A Partial Copy Behind
+    if self.export_worker is not None:
+      self.export_worker.wait()
+    super().closeEvent(event)
+
 
   """
   
@@ -1024,7 +1125,8 @@ class ResultsViewerWidget(QWidget):
 
     Postconditions:
       1. The Colormap Used Is Changed To The Selected Colormap
-      2. The .tif File Is Reloaded With The New Colormap Filter Through self._load_Tif_file(...)
+      2. The .tif File Is Re-Rendered With The New Colormap Filter Through self._render_current_tif()
+         Once No Further Changes Arrive Within The Debounce Interval
       3. The File Viewer Is Updated To Display The New Colormap
       4. The File Information Label Will Be Adjusted With The New Colormap
   
@@ -1033,9 +1135,28 @@ class ResultsViewerWidget(QWidget):
     # Set The Current Colormap To The Selected One
     self.current_colormap = colormap_name
     
-    # Reload The .tif File With The New Colormap
+    # Reload The .tif File With The New Colormap (Restarting The Timer Drops Any Pending Reload)
     if self.current_file_path and self.current_file_path.suffix.lower() in ('.tif', '.tiff'):
-        self._load_tif_file(self.current_file_path)
+        self.reload_timer.start()
+
+
+  """
+
+    Desc: Function Will Re-Render The Currently Selected .tif File. This Is
+    Connected To self.reload_timer So A Burst Of Colormap Changes Only
+    Results In A Single Re-Render Using The Latest Selection.
+
+    Preconditions:
+      1. Called From self.reload_timer's timeout Signal
+
+    Postconditions:
+      1. If The Current File Is A .tif File, It Is Re-Rendered Through self._render_current_tif(),
+         Reusing The Already Decoded Data
+
+  """
+  def _reload_current_tif(self):
+    if self.current_file_path and self.current_file_path.suffix.lower() in ('.tif', '.tiff'):
+        self._render_current_tif()
   
 
   """
@@ -1086,8 +1207,9 @@ class ResultsViewerWidget(QWidget):
   
     Desc: Function Will Allow User To Export A Selected File To A User-Specified Location
     On Their System. When A User Wants To Export A File, It Will Prompt The User For A Destination Directory
-    And Copy The File To That Location. It Will Also Handle The Case Where The File Cannot Be Exported,
-    And Provide An Error Message.
+    And Copy The File To That Location. The Copy Runs On A FileExportWorker Thread With A Progress
+    Dialog (Which Can Cancel It), So The UI Stays Responsive For Large Files. It Will Also Handle
+    The Case Where The File Cannot Be Exported, And Provide An Error Message.
 
     Preconditions:
       1. The File Path Should Be A Valid File Path
@@ -1118,14 +1240,110 @@ class ResultsViewerWidget(QWidget):
     if not dest_path:
       return
 
-    # Attempt To Copy Our File Into Our Destination Path
-    try:
-      import shutil
-      shutil.copy2(self.current_file_path, dest_path)
-      QMessageBox.information(self, "Success", f"File exported to {dest_path}")
-    # If We Fail Copying Our File's Contents, Return Error Message
-    except Exception as e:
-      QMessageBox.warning(self, "Error", f"Could not export file: {str(e)}")
+    # Show Our Progress (In Percent, Since Byte Counts Can Exceed A QProgressDialog's int Range)
+    self.export_progress = QProgressDialog(f"Exporting {self.current_file_path.name}...", "Cancel", 0, 100, self)
+    self.export_progress.setWindowTitle("Export File")
+    self.export_progress.setWindowModality(Qt.WindowModal)
+    self.export_progress.setMinimumDuration(500)
+    self.export_progress.setValue(0)
+
+    # Hand Off Copying Our File Into Our Destination Path To A Worker Thread
+    self.export_worker = FileExportWorker(self.current_file_path, dest_path, parent=self)
+    self.export_worker.bytes_copied.connect(self._on_export_progress)
+    self.export_worker.export_completed.connect(self._on_export_completed)
+    self.export_worker.export_failed.connect(self._on_export_failed)
+    self.export_worker.finished.connect(self._on_export_finished)
+    self.export_progress.canceled.connect(self.export_worker.cancel)
+    self.export_worker.start()
+
+
+  """
+
+    Desc: Function Will Update Our Export Progress Dialog As The
+    FileExportWorker Copies The File.
+
+    Preconditions:
+      1. Called From FileExportWorker's bytes_copied Signal
+
+    Postconditions:
+      1. The Progress Dialog Shows The Percentage Of Bytes Copied
+
+  """
+  def _on_export_progress(self, copied):
+    if self.export_worker is not None and self.export_progress is not None and self.export_worker.total_bytes:
+      self.export_progress.setValue(int(copied * 100 / self.export_worker.total_bytes))
+
+
+  """
+
+    Desc: Function Will Tell The User Their File Was Exported Successfully.
+
+    Preconditions:
+      1. Called From FileExportWorker's export_completed Signal
+
+    Postconditions:
+      1. A Success Message Is Shown With The Destination Path
+
+  """
+  def _on_export_completed(self, dest_path):
+    self._close_export_progress()
+    QMessageBox.information(self, "Success", f"File exported to {dest_path}")
+
+
+  """
+
+    Desc: Function Will Tell The User Their File Could Not Be Exported.
+
+    Preconditions:
+      1. Called From FileExportWorker's export_failed Signal
+
+    Postconditions:
+      1. An Error Message Is Shown With The Reason The Export Failed
+
+  """
+  def _on_export_failed(self, message):
+    self._close_export_progress()
+    QMessageBox.warning(self, "Error", f"Could not export file: {message}")
+
+
+  """
+
+    Desc: Function Will Clean Up Once Our FileExportWorker Finishes,
+    Whether It Completed, Failed, Or Was Canceled.
+
+    Preconditions:
+      1. Called From FileExportWorker's finished Signal
+
+    Postconditions:
+      1. The Progress Dialog Is Closed
+      2. The Worker Is Scheduled For Deletion And Cleared
+
+  """
+  def _on_export_finished(self):
+    self._close_export_progress()
+    if self.export_worker is not None:
+      self.export_worker.deleteLater()
+      self.export_worker = None
+
+
+  """
+
+    Desc: Function Will Close And Clear Our Export Progress Dialog.
+
+    Preconditions:
+      1. None
+
+    Postconditions:
+      1. The Progress Dialog (If Any) Is Closed And Cleared
+
+  """
+  def _close_export_progress(self):
+    if self.export_progress is not None:
+      # Disconnect So Closing The Dialog Doesn't Register As A User Cancel
+      self.export_progress.canceled.disconnect()
+      self.export_progress.close()
+      self.export_progress.deleteLater()
+      self.export_progress = None
 
 
   """
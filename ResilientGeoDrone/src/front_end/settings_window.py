@@ -1,4 +1,8 @@
 from pathlib import Path
+import os
+import copy
+import pickle
+from functools import partial
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QFormLayout,
                            QSpinBox, QLineEdit, QComboBox, QPushButton,
                            QDoubleSpinBox, QListWidget, QHBoxLayout,
@@ -9,6 +13,12 @@ from PyQt5.QtGui import QTextCursor
 import yaml
 from datetime import datetime
 
+# Prefer The libyaml-Backed C Loader/Dumper, Falling Back To Pure Python If PyYAML Was Built Without It
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 
 """
@@ -23,6 +33,12 @@ from datetime import datetime
 """
 class SettingsWindow(QWidget):
 
+    # Parsed Configs Shared Across Windows, Keyed By Path -> ((st_mtime_ns, st_size), config)
+    config_cache = {}
+
+    # Amount Of A Large Log File That Is Read When It Is Selected
+    log_tail_bytes = 256 * 1024
+
     """
     
         Desc: Initializes Our Settings Window With A Configuration Path
@@ -53,14 +69,18 @@ class SettingsWindow(QWidget):
         self.config_path = config_path
         self.logs_dir = Path(__file__).parent.parent.parent / "logs"
         self.env_widgets = {}
+        self.env_builders = {}
 
         # Set-Up Our Pop-Up Window
         self.setWindowTitle("Settings")
         self.setMinimumSize(800, 600)
 
         # Load Current Config
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = self._load_config(config_path)
+
+        # Remember What's On Disk (The Memoized Copy Is Never Mutated) So Saving Without Changes Can Skip The Write
+        config_key = Path(config_path).resolve()
+        self.config_snapshot = (config_key, SettingsWindow.config_cache[config_key][1])
 
         # Set-Up A Vertical Layout (Make Our Overall Settings In A Stacked Order)
         layout = QVBoxLayout(self)
@@ -91,6 +111,97 @@ class SettingsWindow(QWidget):
         layout.addLayout(buttons_layout)
 
 
+    """
+
+        Desc: Function Loads The Configuration File. Parsed Configs Are
+        Memoized On The Class Along With The YAML's Modification Time And
+        Size, So Reopening The Settings Window Hands Back A Copy Of The
+        Already Parsed Config While The File Is Unchanged.
+
+        Preconditions:
+            1. config_path: Path To An Existing YAML Configuration File
+
+        Postconditions:
+            1. Return The Parsed Configuration Dictionary (Owned By The Caller)
+            2. Refresh The Memoized Entry If It Was Missing Or Stale
+
+    """
+    def _load_config(self, config_path):
+        # Raises FileNotFoundError For A Missing Config Before We Touch The Caches
+        stat = os.stat(config_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = Path(config_path).resolve()
+
+        cached = SettingsWindow.config_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
+        config = self._read_config_file(config_path, signature)
+        SettingsWindow.config_cache[key] = (signature, copy.deepcopy(config))
+        return config
+
+
+    """
+
+        Desc: Function Reads The Configuration File From Disk. Parsing YAML
+        Is Slow, So The Parsed Config Is Also Pickled To A Sidecar File Next
+        To It Along With The YAML's Signature. If The Signature Still Matches
+        On The Next Read The Pickle Is Used And The YAML Isn't Parsed.
+
+        Preconditions:
+            1. config_path: Path To An Existing YAML Configuration File
+            2. signature: The File's (st_mtime_ns, st_size)
+
+        Postconditions:
+            1. Return The Parsed Configuration Dictionary
+            2. Refresh The Sidecar Cache If It Was Missing Or Stale
+
+    """
+    def _read_config_file(self, config_path, signature):
+        cache_path = self._config_cache_path(config_path)
+
+        # The Signature Is Pickled Ahead Of The Config So A Stale Cache Is Rejected Without Loading It
+        try:
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) == signature:
+                    return pickle.load(f)
+        except Exception:
+            pass
+
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=_Loader)
+
+        # Write Through A Temporary File So A Half-Written Cache Is Never Read
+        temp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(signature, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # The Cache Is Only An Optimization, So An Unwritable Directory Isn't An Error
+            pass
+
+        return config
+
+
+    """
+
+        Desc: Function Returns The Path Of The Pickled Sidecar Cache For
+        A Configuration File (e.g. config.yaml -> config.yaml.pkl).
+
+        Preconditions:
+            1. config_path: Path To A Configuration File
+
+        Postconditions:
+            1. Return The Path To The Sidecar Cache
+
+    """
+    def _config_cache_path(self, config_path):
+        config_path = Path(config_path)
+        return config_path.with_name(config_path.name + ".pkl")
+
+
     """
     
         Desc: Function Adds A Tab For Preprocessing Settings. The Tab
@@ -404,14 +515,13 @@ class SettingsWindow(QWidget):
             'sfm-algorithm': ['incremental', 'planar', 'triangulation']
         }
 
-        # Create A Tab For Each Environment
-        for env in ['sunny', 'rainy', 'foggy', 'night']:
+        # Fills In An Environment's Tab (Deferred Until The Tab Is First Shown)
+        def build_env_tab(env, env_tab):
 
             # Add Dictionary Element
             self.env_widgets[env] = {}
 
-            # Create Our Tab And Its Layout
-            env_tab = QWidget()
+            # Create Our Tab's Layout
             main_layout = QVBoxLayout(env_tab)
 
             # Add Scroll Area For The Tab
@@ -582,9 +692,16 @@ class SettingsWindow(QWidget):
             note_label.setStyleSheet("color: #FFA500;") # Orange Warning Color
             main_layout.addWidget(note_label)
 
-            # Add The Tab To The Environment Tabs
+        # Create An Empty Tab For Each Environment, Remembering How To Fill It In
+        for env in ['sunny', 'rainy', 'foggy', 'night']:
+            env_tab = QWidget()
+            self.env_builders[env] = partial(build_env_tab, env, env_tab)
             self.env_tabs.addTab(env_tab, env.capitalize())
 
+        # Build The Visible Environment Now And The Others When First Selected
+        self.env_tabs.currentChanged.connect(self._build_env_tab)
+        self._build_env_tab(self.env_tabs.currentIndex())
+
         env_layout.addWidget(self.env_tabs)
 
         # Add The Environment Layout To The Group
@@ -594,6 +711,29 @@ class SettingsWindow(QWidget):
         tabs.addTab(tab, "Point Cloud")
 
 
+    """
+
+        Desc: Function Builds The Widgets Of An Environment Tab The First
+        Time It Is Shown. Environments The User Never Opens Are Never Built,
+        And Saving Leaves Their Values In The Config Untouched.
+
+        Preconditions:
+            1. index: Index Of The Selected Environment Tab (-1 If None)
+
+        Postconditions:
+            1. The Environment's Widgets Are Built And Added To env_widgets
+            2. Nothing Happens If The Tab Was Already Built
+
+    """
+    def _build_env_tab(self, index):
+        if index < 0:
+            return
+
+        builder = self.env_builders.pop(self.env_tabs.tabText(index).lower(), None)
+        if builder is not None:
+            builder()
+
+
     """
     
         Desc: Function Adds A Tab For Logs. The Tab Will Allow The User
@@ -651,8 +791,14 @@ class SettingsWindow(QWidget):
         self.log_content.setLineWrapMode(QTextEdit.NoWrap)
         self.log_content.setAcceptRichText(True)
 
+        # Large Logs Only Show Their Tail Until The User Asks For The Rest
+        self.load_full_btn = QPushButton("Load Full Log")
+        self.load_full_btn.setEnabled(False)
+        self.load_full_btn.clicked.connect(self.load_full_log)
+
         # Add The Text Edit To The Layout
         content_layout.addWidget(self.log_content)
+        content_layout.addWidget(self.load_full_btn)
         content_group.setLayout(content_layout)
 
         # Add The Groups To The Main Layout
@@ -700,41 +846,66 @@ class SettingsWindow(QWidget):
         if not self.logs_dir.exists():
             return
         
-        # Get All Log Files
-        log_files = self.logs_dir.glob("*.log")
+        # Get All Log Files And Their Stats In A Single Directory Pass
+        with os.scandir(self.logs_dir) as entries:
+            log_files = [(entry.path, entry.stat()) for entry in entries
+                         if entry.name.endswith(".log") and entry.is_file()]
 
         # Sort By Date
-        log_files = sorted(log_files, key=lambda x: x.stat().st_mtime, reverse=True)
-
-        # Add Each Log File To The List
-        for log_file in log_files:
-            size_kb = log_file.stat().st_size / 1024
-            modificationTime = datetime.fromtimestamp(log_file.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        log_files.sort(key=lambda log_file: log_file[1].st_mtime, reverse=True)
+
+        # Logs Written In The Same Second Share Their Formatted Timestamp
+        timestamps = {}
+
+        # Create An Item For Each Log File
+        items = []
+        for log_path, log_stat in log_files:
+            size_kb = log_stat.st_size / 1024
+            second = int(log_stat.st_mtime)
+            modificationTime = timestamps.get(second)
+            if modificationTime is None:
+                modificationTime = timestamps[second] = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
             item_text = f"Log Report ({size_kb:.2f} KB) - {modificationTime}"
             item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, str(log_file))
-            self.logs_list.addItem(item)
+            item.setData(Qt.UserRole, log_path)
+            items.append(item)
+
+        # Add Them All With Repaints And Signals Held Off So The List Only Updates Once
+        self.logs_list.setUpdatesEnabled(False)
+        self.logs_list.blockSignals(True)
+        try:
+            for item in items:
+                self.logs_list.addItem(item)
+        finally:
+            self.logs_list.blockSignals(False)
+            self.logs_list.setUpdatesEnabled(True)
 
 
     """
     
         Desc: Function Displays The Content Of The Selected Log File.
         It Will Read The Log File And Display The Content In The Text Edit.
-        It Will Also Scroll To The End Of The Text Edit. If No Log File
-        Is Selected, It Will Clear The Text Edit.
+        Logs Larger Than log_tail_bytes Only Have Their Tail Read (Starting
+        At A Line Boundary) Unless full Is Set, Which The Load Full Log
+        Button Does. It Will Also Scroll To The End Of The Text Edit. If
+        No Log File Is Selected, It Will Clear The Text Edit.
 
         Preconditions:
             1. logs_list Should Be A QListWidget Object
             2. log_content Should Be A QTextEdit Object
+            3. full: Whether To Read The Whole Log Regardless Of Its Size
         
         Postconditions:
-            1. The Content Of The Selected Log File Will Be Displayed
+            1. The Content (Or Tail) Of The Selected Log File Will Be Displayed
             2. The Text Edit Will Scroll To The End
-            3. If No Log File Is Selected, The Text Edit Will Be Cleared
-            4. If The Log File Cannot Be Read, An Error Message Will Be Displayed
+            3. The Load Full Log Button Is Enabled Only For Truncated Logs
+            4. If No Log File Is Selected, The Text Edit Will Be Cleared
+            5. If The Log File Cannot Be Read, An Error Message Will Be Displayed
     
     """
-    def display_log_content(self):
+    def display_log_content(self, full=False):
+        self.load_full_btn.setEnabled(False)
+
         #  Check For Selected Item
         selected = self.logs_list.selectedItems()
         if not selected:
@@ -745,12 +916,23 @@ class SettingsWindow(QWidget):
         log_file = Path(selected[0].data(Qt.UserRole))
 
         try:
-            # Read The Log File
-            with open(log_file, 'r') as f:
-                content = f.read()
+            # Read The Log File (Only Its Tail If It's Large)
+            with open(log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                truncated = not full and size > self.log_tail_bytes
+                if truncated:
+                    f.seek(size - self.log_tail_bytes)
+
+                    # Drop The Partial Line We Landed In
+                    f.readline()
+                content = f.read().decode('utf-8', errors='replace')
+
+            if truncated:
+                content = f"... Log Truncated, Showing The Last {self.log_tail_bytes // 1024} KB ...\n" + content
+                self.load_full_btn.setEnabled(True)
 
             # Display The Content
-            self.log_content.setText(content)
+            self.log_content.setPlainText(content)
 
             # Scroll To One ENd
             cursor = self.log_content.textCursor()
@@ -758,7 +940,23 @@ class SettingsWindow(QWidget):
             self.log_content.setTextCursor(cursor)
 
         except Exception as e:
-            self.log_content.setText(f"Error Reading Log File: {str(e)}")
+            self.log_content.setPlainText(f"Error Reading Log File: {str(e)}")
+
+
+    """
+
+        Desc: Function Displays The Whole Selected Log File, Bypassing The
+        Tail-Only Read Used For Large Logs.
+
+        Preconditions:
+            1. None
+
+        Postconditions:
+            1. The Full Content Of The Selected Log File Will Be Displayed
+
+    """
+    def load_full_log(self):
+        self.display_log_content(full=True)
 
     """
     
@@ -1108,9 +1306,24 @@ class SettingsWindow(QWidget):
                     del geospatial_config['analysis']['terrain']
 
 
-            # Save To File
-            with open(self.config_path, 'w') as f:
-                yaml.safe_dump(self.config, f, default_flow_style=False, sort_keys=False)
+            # Nothing To Write If The Settings Still Match What We Loaded From (Or Last Saved To) This File
+            config_key = Path(self.config_path).resolve()
+            if self.config_snapshot != (config_key, self.config):
+
+                # Emit The YAML In Memory, Then Write It In One Go To A Temporary File That Replaces
+                # The Config Atomically, So A Crash Mid-Save Can't Leave A Half-Written Config Behind
+                content = yaml.dump(self.config, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+                temp_path = Path(self.config_path).with_name(Path(self.config_path).name + ".tmp")
+                with open(temp_path, 'w') as f:
+                    f.write(content)
+                os.replace(temp_path, self.config_path)
+
+                # The Sidecar Cache Now Describes An Older Config, While What We Just Wrote Is Already Parsed
+                self._config_cache_path(self.config_path).unlink(missing_ok=True)
+                stat = os.stat(self.config_path)
+                saved_config = copy.deepcopy(self.config)
+                SettingsWindow.config_cache[config_key] = ((stat.st_mtime_ns, stat.st_size), saved_config)
+                self.config_snapshot = (config_key, saved_config)
 
             if not silent:
                 QMessageBox.information(self, "Success", "Settings saved successfully!")
@@ -1141,7 +1354,7 @@ class SettingsWindow(QWidget):
 
             # Now Add Changes
             with open(default_config_file, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=_Loader)
 
             # Reinitialize all widgets
             self.__init__(self.config_path)
@@ -0,0 +1,528 @@
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot
+import rasterio
+from rasterio.enums import Resampling, MaskFlags
+import numpy as np
+import matplotlib.pyplot as plt
+import cv2
+from skimage import measure
+
+
+
+"""
+
+  Desc: This Class Is Utilized To Decode And Render A .tif File In A
+  Separate Thread To Keep The Results Viewer Responsive. Single-Band
+  Files (DSM, DTM, CHM) Are Hillshaded, Colormapped, And Contoured,
+  While Multi-Band Files Are Displayed As Stretched RGB. The Worker
+  Never Touches Qt Widgets; It Emits The Finished Image As A NumPy
+  Array Which The Viewer Wraps Into A QPixmap On The GUI Thread.
+
+
+"""
+class TifRenderWorker(QThread):
+
+  # Define Signals For Communicating With Our Main Thread (Generation, Image, Info / Generation, Error)
+  render_completed = pyqtSignal(int, object, str)
+  render_failed = pyqtSignal(int, str)
+
+
+  """
+
+    Desc: Initializes Our Render Worker With The File To Render And A Snapshot
+    Of The Viewer's Display Settings. The Generation Is Echoed Back With Every
+    Signal So The Viewer Can Discard Results From Superseded Renders. Any
+    Previously Computed Hillshade Or Contour Caches Are Passed In And Updated
+    On The Worker, To Be Picked Back Up By The Viewer Once The Render Completes.
+    Likewise, The Previously Decoded Single-Band Data (current_tif) Is Reused
+    Without Reopening The File When The Path And Scaling Settings Match, And
+    Scratch Buffers From Earlier Renders Are Recycled For Transient Arrays.
+
+    Preconditions:
+      1. generation Is The Viewer's Render Counter For This Request
+      2. file_path Is A Valid Path To A .tif File
+      3. colormap Is A Valid Matplotlib Colormap Name
+      4. contour_line_count Is A Non-Negative Integer
+      5. auto_scaling / scale_factor_override Match The Viewer's Resolution Controls
+      6. hillshade_cache / contour_cache Are None Or The Viewer's Current Caches
+      7. cmap_lut Is None Or A Precomputed (256, 4) uint8 Lookup Table For colormap
+      8. current_tif Is None Or The Viewer's Last Decoded Single-Band Data
+      9. scratch Is None Or A Dictionary Of Buffers Not In Use By Any Other Worker
+
+    Postconditions:
+      1. Initialize Our Worker Thread
+      2. Store Our Render Settings And Caches
+      3. Set Is Canceled Flag To False
+
+  """
+  def __init__(self, generation, file_path, colormap, contour_line_count, auto_scaling,
+               scale_factor_override, hillshade_cache=None, contour_cache=None, cmap_lut=None,
+               current_tif=None, scratch=None, parent=None):
+    super().__init__(parent)
+    self.generation = generation
+    self.file_path = file_path
+    self.colormap = colormap
+    self.contour_line_count = contour_line_count
+    self.auto_scaling = auto_scaling
+    self.scale_factor_override = scale_factor_override
+    self.hillshade_cache = hillshade_cache
+    self.contour_cache = contour_cache
+    self.cmap_lut = cmap_lut
+    self.current_tif = current_tif
+    self.scratch = scratch if scratch is not None else {}
+    self.is_canceled = False
+
+
+  """
+
+    Desc: Run Method Delegated To Our Worker Thread. Opens The .tif File
+    And Renders It Based On Its Band Count, Unless Matching Decoded Data
+    Was Handed In, In Which Case The File Isn't Touched. Emits render_completed With
+    The Rendered Image And File Information, Or render_failed If Anything
+    Goes Wrong. Nothing Is Emitted If The Worker Was Canceled.
+
+    Preconditions:
+      1. Worker Was Initialized With A Valid File Path
+
+    Postconditions:
+      1. Emit render_completed With A (H, W, 3|4) uint8 Image And Info Text
+      2. Emit render_failed With The Error Message On Failure
+
+  """
+  @pyqtSlot()
+  def run(self):
+    try:
+      # Only Decode When We Don't Already Hold This File At These Scaling Settings
+      if self.current_tif is None or self.current_tif['key'] != self._decode_key():
+        self.current_tif = None
+        with rasterio.Env(GDAL_CACHEMAX=512):
+          with rasterio.open(str(self.file_path)) as src:
+            # Single Band Photo (e.g. DSM, DTM) Or Multi-Band (e.g. RGB)
+            if src.count == 1:
+              self.current_tif = self._decode_single_band(src)
+            else:
+              image, info = self._render_multi_band(src)
+
+      if self.current_tif is not None:
+        image, info = self._render_single_band(self.current_tif)
+
+      if not self.is_canceled:
+        self.render_completed.emit(self.generation, image, info)
+    except Exception as e:
+      if not self.is_canceled:
+        self.render_failed.emit(self.generation, str(e))
+
+
+  """
+
+    Desc: This Method Is Used To Cancel The Render. A Canceled Worker
+    Will Finish Its Current Step But Won't Emit Any Results.
+
+    Preconditions:
+      1. None
+
+    Postconditions:
+      1. Set Is Canceled Flag To True
+
+  """
+  def cancel(self):
+    self.is_canceled = True
+
+
+  """
+
+      Desc: Function Will Return The Key Identifying Decoded Single-Band Data,
+      Which Depends Only On The File And Our Resolution Settings (Colormap
+      And Contour Changes Can Reuse The Same Decoded Data).
+
+      Preconditions:
+          1. None
+
+      Postconditions:
+          1. Returns A (Path, Auto Scaling, Scale Factor Override) Tuple
+
+  """
+  def _decode_key(self):
+    return (str(self.file_path), self.auto_scaling, self.scale_factor_override)
+
+
+  """
+
+      Desc: Function Will Decode A Single-Band .tif File (Height Map) Into
+      float32 Elevation Data Along With The Statistics Needed To Render It.
+      Large Images Are Downscaled Based On The Auto Scaling Or User-Defined
+      Resolution.
+
+      Preconditions:
+          1. src Is An Open Single-Band Rasterio Dataset
+
+      Postconditions:
+          1. Returns A Dictionary With The Decoded Data, Its Percentile And
+             Min/Max Bounds, Mean, Resolution, And Decode Key
+
+  """
+  def _decode_single_band(self, src):
+    # Determine Our Display Resolution...
+    height, width = src.height, src.width     # Get The Height And Width Of The Image
+    scale_factor = 1.0
+
+    if height * width > 4000000:              # 4 Megapixels Threshold
+      if self.auto_scaling:
+        # Use Automatic Scaling Based On Image Size
+        scale_factor = np.sqrt(5000000 / (height * width))
+      else:
+        # Use User-Defined Scaling Factor
+        scale_factor = self.scale_factor_override
+
+    # Don't Scale Up If Scale Factor > 1
+    if scale_factor < 1.0:
+      new_height = int(height * scale_factor)
+      new_width = int(width * scale_factor)
+
+      if src.overviews(1):
+        # Decimated Read, GDAL Picks The Closest Overview So The Full Resolution Is Never Materialized
+        data = self._read_band(src, out_shape=(new_height, new_width))
+      else:
+        # No Overviews, So Read Full Resolution (Into A Recycled Buffer) And Use High-Quality Lanczos Resampling
+        data = self._read_band(src, out=self._scratch('raw', (height, width), np.float32))
+        data = cv2.resize(data, (new_width, new_height),
+                        interpolation=cv2.INTER_LANCZOS4)
+
+        # Apply Subtle Sharpening To Preserve Perceived Detail
+        kernel = np.array([[-0.1, -0.1, -0.1],
+                        [-0.1,  1.8, -0.1],
+                        [-0.1, -0.1, -0.1]])
+        data = cv2.filter2D(data, -1, kernel)
+    else:
+      data = self._read_band(src)
+
+    # Compute Our Minimum And Maximum Values For The Data This Is Used For The Hillshade And Color Mapping
+    vmin, vmax = np.nanpercentile(data, [2, 98])
+    amin, amax = np.nanmin(data), np.nanmax(data)
+
+    return {'key': self._decode_key(), 'data': data, 'vmin': vmin, 'vmax': vmax,
+            'amin': amin, 'amax': amax, 'mean': np.nanmean(data), 'res': src.res}
+
+
+  """
+
+      Desc: Function Will Render Decoded Single-Band Data (Height Map) With
+      Enhanced Terrain Visualization Techniques, Including Hillshading,
+      Colormap Application, And Contour Lines. The Image Is Produced At The
+      Decoded Resolution Directly (The Viewer Draws Its Own Colorbar).
+
+      Preconditions:
+          1. tif Is A Dictionary Returned By self._decode_single_band(...)
+
+      Postconditions:
+          1. Returns A (H, W, 4) uint8 RGBA Image (NoData Transparent)
+          2. Returns The File Name And Elevation Statistics As Info Text
+
+  """
+  def _render_single_band(self, tif):
+    data = tif['data']
+    vmin, vmax, amin, amax = tif['vmin'], tif['vmax'], tif['amin'], tif['amax']
+
+    # Hillshade Intensity Is Colormap Independent, So Only Compute It Once Per File/Resolution
+    hillshade_key = (str(self.file_path), data.shape)
+    if self.hillshade_cache is None or self.hillshade_cache[0] != hillshade_key:
+      intensity = self._compute_hillshade(data, azdeg=315, altdeg=35, vert_exag=3)
+      # NaN Intensity (NoData Neighbours) Set To 0.5, Which Leaves Soft Light Colors Unchanged
+      np.nan_to_num(intensity, copy=False, nan=0.5)
+      self.hillshade_cache = (hillshade_key, intensity)
+    intensity = self.hillshade_cache[1]
+
+    # Apply Our Colormap And Hillshade To The Provided .tif Data
+    # Sample Our Colormap Into A Lookup Table Unless The Viewer Already Provided One
+    if self.cmap_lut is None:
+      self.cmap_lut = (plt.get_cmap(self.colormap)(np.linspace(0, 1, 256)) * 255).astype(np.uint8)
+    image = self._blend_colormap(data, intensity, self.cmap_lut, vmin, vmax,
+                                 out=self._scratch('rgba_back', data.shape + (4,), np.uint8))
+
+    # Add Contour Lines On .tif Image To Help With Texturing (Cached Mask, Only Rebuilt When The Count Changes)
+    if self.contour_line_count > 0:
+      contour_key = (str(self.file_path), data.shape, self.contour_line_count)
+      if self.contour_cache is None or self.contour_cache[0] != contour_key:
+        self.contour_cache = (contour_key, self._build_contour_mask(data, amin, amax))
+      contour_mask = self.contour_cache[1]
+
+      # Darken Contour Pixels Toward Black At 0.25 Alpha
+      line_shade = 1.0 - 0.25 * (contour_mask.astype(np.float32) * (1.0 / 255.0))
+      image[..., :3] = image[..., :3] * line_shade[..., np.newaxis]
+
+    # The Viewer Displays This Buffer Directly, So Swap It To The Front And Have The Next Render Write To The Other
+    self.scratch['rgba_back'], self.scratch['rgba_front'] = self.scratch.get('rgba_front'), self.scratch['rgba_back']
+
+    stats = {
+          "Min elevation": f"{amin:.2f}m",
+          "Max elevation": f"{amax:.2f}m",
+          "Mean elevation": f"{tif['mean']:.2f}m",
+          "Resolution": f"{tif['res'][0]:.2f}m/pixel"
+    }
+    # Format With Key: Value Pairs
+    stats_str = " | ".join([f"{k}: {v}" for k, v in stats.items()])
+    return image, f"{self.file_path.name} - {stats_str}"
+
+
+  """
+
+      Desc: Function Will Render A Multi-Band .tif File (e.g. Orthophoto)
+      As An RGB Image Without Any Colormap. Each Of The First Three Bands
+      Is Contrast Stretched Between Its 2nd And 98th Percentiles.
+
+      Preconditions:
+          1. src Is An Open Multi-Band Rasterio Dataset
+
+      Postconditions:
+          1. Returns A (H, W, 3) uint8 RGB Image
+          2. Returns The File Name And Band Range As Info Text
+
+  """
+  def _render_multi_band(self, src):
+    # Multi-Band Image (RGB) Will Simply Just Be Displayed Without Filter
+    rgb = np.zeros((src.height, src.width, 3), dtype=np.uint8)
+
+    # Read All 3 Bands
+    for i in range(min(3, src.count)):
+      band = src.read(i+1)
+
+      # Normalize Our Bands Contents
+      if np.any(band):
+        min_val = np.percentile(band[band > 0], 2)
+        max_val = np.percentile(band[band > 0], 98)
+        if min_val == max_val:
+          # Increment Through Our Buffer And Set Our Values For Each Entry
+          rgb[:,:,i] = 0
+        else:
+          # Increment Through Our Buffer And Set Our Values For Each Entry
+          rgb[:,:,i] = np.clip((band - min_val) * 255 / (max_val - min_val), 0, 255).astype(np.uint8)
+
+    return rgb, f"{self.file_path.name} - Minimum Elevation: {min_val:.2f}m | Maximum Elevation: {max_val:.2f}m"
+
+
+  """
+
+    Desc: Function Will Return A Scratch Array Of The Given Shape And Type,
+    Backed By A Flat Buffer Kept In self.scratch. The Buffer Only Grows To
+    The Largest Size Requested, So Repeated Renders Reuse The Same Memory
+    Instead Of Allocating A Fresh Full-Size Array Each Time.
+
+    Preconditions:
+      1. name Identifies The Buffer's Purpose (e.g. 'raw', 'rgba')
+      2. shape Is The Required Array Shape
+      3. dtype Is The Required NumPy Data Type
+
+    Postconditions:
+      1. Returns A C-Contiguous Array View With Undefined Contents
+
+  """
+  def _scratch(self, name, shape, dtype):
+    size = int(np.prod(shape))
+    buffer = self.scratch.get(name)
+    if buffer is None or buffer.dtype != dtype or buffer.size < size:
+      buffer = np.empty(size, dtype=dtype)
+      self.scratch[name] = buffer
+    return buffer[:size].reshape(shape)
+
+
+  """
+
+    Desc: Function Will Read The First Band Of A Dataset As float32 With
+    NoData Values Replaced By NaN. Invalid Pixels Come From The Dataset's
+    Mask Band When It Has One, Otherwise From Its NoData Value. When
+    out_shape Is Given The Read Is Decimated By GDAL (Using The Dataset's
+    Overviews When Available). When out Is Given The Full Band Is Read
+    Directly Into That Buffer Instead.
+
+    Preconditions:
+      1. src Is An Open Rasterio Dataset
+      2. out_shape Is None Or A (Height, Width) Tuple
+      3. out Is None Or A (src.height, src.width) float32 Array
+
+    Postconditions:
+      1. Returns A 2D float32 Array With NaN For NoData
+
+  """
+  def _read_band(self, src, out_shape=None, out=None):
+    # Read The Data As float32 (Halves Memory Traffic Versus float64)
+    if out is not None:
+      src.read(1, out=out)
+      data = out
+    elif out_shape is None:
+      data = src.read(1, out_dtype='float32')
+    else:
+      data = src.read(1, out_shape=out_shape, out_dtype='float32', resampling=Resampling.lanczos)
+
+    # With A Real Mask Band (e.g. COG Internal Masks), Use GDAL's Cheap uint8 Mask (Overview-Aware) Instead Of A Value Scan
+    if MaskFlags.per_dataset in src.mask_flag_enums[0]:
+      np.putmask(data, src.dataset_mask(out_shape=data.shape) == 0, np.nan)
+    # For Given NoData Value, Set To NaN In-Place For Visualization (No Extra Full-Size Copy)
+    elif src.nodata is not None:
+      np.putmask(data, data == src.nodata, np.nan)
+    return data
+
+
+  """
+
+    Desc: Function Will Compute Hillshade Intensity For The Given Elevation
+    Data. Follows The Same Formula As LightSource.hillshade (Surface Normal
+    Dotted With The Light Direction, Then Rescaled To [0, 1]) But Stays In
+    float32 Throughout, Takes Gradients From Shifted-Slice Differences, And
+    Evaluates The Dot Product Directly From Them, Avoiding The Full-Size
+    float64 (H, W, 3) Normal Array.
+
+    Preconditions:
+      1. data Is A 2D float32 Array (NaN For NoData)
+      2. azdeg / altdeg Are The Light Source Azimuth And Altitude In Degrees
+      3. vert_exag Is The Vertical Exaggeration Applied To The Elevation
+
+    Postconditions:
+      1. Returns A (H, W) float32 Intensity Array With Values In [0, 1]
+      2. Pixels Next To NoData Are NaN
+
+  """
+  def _compute_hillshade(self, data, azdeg, altdeg, vert_exag):
+    # Light Direction As A Unit Vector (Azimuth Measured Clockwise From North)
+    az, alt = np.radians(90 - azdeg), np.radians(altdeg)
+    lx, ly, lz = np.float32([np.cos(az) * np.cos(alt), np.sin(az) * np.cos(alt), np.sin(alt)])
+
+    # First Row Is The "Top" Of The Image, So Our Row Spacing Is Negative
+    e_dy = self._central_difference(data, -1.0 / vert_exag)
+    e_dx = self._central_difference(data.T, 1.0 / vert_exag).T
+
+    # Intensity = (-dx * lx - dy * ly + lz) / |(-dx, -dy, 1)|
+    intensity = lz - e_dx * lx - e_dy * ly
+    e_dx *= e_dx
+    e_dy *= e_dy
+    e_dx += e_dy
+    e_dx += 1
+    np.sqrt(e_dx, out=e_dx)
+    intensity /= e_dx
+
+    # Rescale To [0, 1], Keeping The Range Of The Raw Intensity
+    imin, imax = intensity.min(), intensity.max()
+    if (imax - imin) > 1e-6:
+      intensity -= imin
+      intensity /= (imax - imin)
+    np.clip(intensity, 0, 1, out=intensity)
+    return intensity
+
+
+  """
+
+    Desc: Function Will Compute The Derivative Of The Given Array Along Its
+    First Axis, Matching np.gradient (Central Differences Inside, One-Sided
+    At The Edges). Differences Are Written Straight Into One Preallocated
+    float32 Buffer Via Shifted Slices, Skipping np.gradient's Temporaries.
+    Transposed Views Can Be Passed To Differentiate Along Columns.
+
+    Preconditions:
+      1. data Is A 2D float32 Array With At Least Two Rows
+      2. spacing Is The Sample Spacing Along The First Axis
+
+    Postconditions:
+      1. Returns A float32 Array Of The Same Shape (And Memory Layout) As data
+
+  """
+  def _central_difference(self, data, spacing):
+    out = np.empty_like(data)
+
+    # Central Differences For Interior Rows
+    np.subtract(data[2:], data[:-2], out=out[1:-1])
+    out[1:-1] *= np.float32(0.5 / spacing)
+
+    # One-Sided Differences For The First And Last Rows
+    np.subtract(data[1], data[0], out=out[0])
+    np.subtract(data[-1], data[-2], out=out[-1])
+    out[0] *= np.float32(1.0 / spacing)
+    out[-1] *= np.float32(1.0 / spacing)
+    return out
+
+
+  """
+
+    Desc: Function Will Rasterize Contour Lines For The Given Elevation Data
+    Into A uint8 Mask The Same Size As The Image. Elevation Is First Quantized
+    To uint16 (Sub-Centimetre Steps For Typical Canopy/Terrain Ranges), Then
+    Each Level Is Traced With skimage.measure.find_contours (Marching Squares,
+    NoData Excluded Through Its Mask) And Drawn With Antialiased cv2.polylines,
+    So The Result Can Be Cached And Re-Composited Over Any Colormap Without
+    Re-Tracing.
+
+    Preconditions:
+      1. data Is A 2D float32 Array (NaN For NoData)
+      2. amin And amax Are The Minimum And Maximum Of The Data
+      3. self.contour_line_count Is Greater Than 0
+
+    Postconditions:
+      1. Returns A (H, W) uint8 Mask Where 255 Marks A Contour Line
+
+  """
+  def _build_contour_mask(self, data, amin, amax):
+    mask = np.zeros(data.shape, dtype=np.uint8)
+
+    # Quantize Into [1, 65535], Leaving NoData At 0
+    scale = 65534.0 / (amax - amin) if amax > amin else 0.0
+    quantized = np.subtract(data, amin, dtype=np.float32)
+    quantized *= scale
+    quantized += 1
+    np.nan_to_num(quantized, copy=False, nan=0)
+    quantized = quantized.astype(np.uint16)
+
+    # Only Trace Through Valid Pixels
+    nodata = np.isnan(data)
+    valid = ~nodata if nodata.any() else None
+
+    # Trace Each Level (Scaled Identically) And Draw Its Polylines Into Our Mask
+    for level in np.linspace(amin, amax, self.contour_line_count):
+      contours = measure.find_contours(quantized, (level - amin) * scale + 1, mask=valid)
+      # find_contours Returns (Row, Column) Points, cv2 Expects (x, y)
+      lines = [np.round(contour[:, ::-1]).astype(np.int32) for contour in contours if len(contour) > 1]
+      if lines:
+        cv2.polylines(mask, lines, False, 255, thickness=1, lineType=cv2.LINE_AA)
+
+    return mask
+
+
+  """
+
+    Desc: Function Will Apply A Colormap To Elevation Data And Blend It With
+    A Precomputed Hillshade Intensity Using Soft Light Blending (Same Formula
+    As LightSource.shade(..., blend_mode='soft')). The Colormap Is Given As A
+    256-Entry uint8 Lookup Table So Each Pixel Is A Single Gather Rather Than
+    A Full Float Colormap Evaluation.
+
+    Preconditions:
+      1. data Is A 2D float32 Array (NaN For NoData)
+      2. intensity Is A 2D Array Of The Same Shape With Values In [0, 1]
+      3. lut Is A (256, 4) uint8 RGBA Colormap Lookup Table
+      4. vmin And vmax Are The Normalization Bounds For The Colormap
+      5. out Is None Or A (H, W, 4) uint8 Array To Write Into
+
+    Postconditions:
+      1. Returns A (H, W, 4) uint8 RGBA Array (out When Given)
+      2. NoData Pixels Are Fully Transparent
+
+  """
+  def _blend_colormap(self, data, intensity, lut, vmin, vmax, out=None):
+    # Quantize Our Data Into Lookup Table Indices (NaN Is Handled Through The Alpha Channel)
+    scale = 255.0 / (vmax - vmin) if vmax > vmin else 0.0
+    idx = np.subtract(data, vmin, dtype=np.float32)
+    idx *= scale
+    np.clip(idx, 0, 255, out=idx)
+    np.nan_to_num(idx, copy=False, nan=0)
+    rgba = np.take(lut, idx.astype(np.uint8), axis=0, out=out)
+
+    # Soft Light Blend Of Colormap And Hillshade: c * ((1 - 2i) * c + 2i), Evaluated In Place
+    c = rgba[..., :3].astype(np.float32)
+    c *= 1.0 / 255.0
+    i = intensity[..., np.newaxis]
+    blend = c * (1 - 2 * i)
+    blend += 2 * i
+    blend *= c
+    blend *= 255
+
+    # Pack Back Into uint8 RGBA, Making NoData Transparent
+    np.clip(blend, 0, 255, out=blend)
+    rgba[..., :3] = blend
+    rgba[..., 3][np.isnan(data)] = 0
+    return rgba
@@ -0,0 +1,92 @@
+import pytest
+import os
+from unittest.mock import patch
+
+from ResilientGeoDrone.src.front_end.file_export_worker import FileExportWorker
+
+
+"""
+
+    Desc: Fixture For Creating A Source File Spanning Several Copy Chunks
+
+"""
+@pytest.fixture
+def source_file(tmp_path):
+    source = tmp_path / "ortho.tif"
+    source.write_bytes(os.urandom(3 * 1024 * 1024 + 123))
+    return source
+
+
+"""
+
+    Desc: Test That An Export Copies Contents And Metadata And Reports Progress
+
+"""
+@pytest.mark.unit
+def test_export_copies_file(qtbot, tmp_path, source_file):
+    dest = tmp_path / "exported.tif"
+    os.utime(source_file, (1000000000, 1000000000))
+    worker = FileExportWorker(source_file, dest)
+    worker.chunk_size = 1024 * 1024
+    progress = []
+    worker.bytes_copied.connect(progress.append)
+
+    with qtbot.waitSignal(worker.export_completed, timeout=10000) as blocker:
+        worker.run()
+
+    assert blocker.args == [str(dest)]
+    assert dest.read_bytes() == source_file.read_bytes()
+    assert os.stat(dest).st_mtime == os.stat(source_file).st_mtime
+    assert len(progress) == 4 and progress[-1] == source_file.stat().st_size
+
+
+"""
+
+    Desc: Test The Buffered Copy Used Where os.sendfile Isn't Available
+
+"""
+@pytest.mark.unit
+def test_export_buffered_copy(qtbot, tmp_path, source_file):
+    dest = tmp_path / "exported.tif"
+    worker = FileExportWorker(source_file, dest)
+    worker.chunk_size = 1024 * 1024
+
+    with patch('ResilientGeoDrone.src.front_end.file_export_worker.sys.platform', 'win32'), \
+         qtbot.waitSignal(worker.export_completed, timeout=10000):
+        worker.run()
+
+    assert dest.read_bytes() == source_file.read_bytes()
+
+
+"""
+
+    Desc: Test That A Canceled Export Removes The Partial Copy And Emits Nothing
+
+"""
+@pytest.mark.unit
+def test_export_canceled(qtbot, tmp_path, source_file):
+    dest = tmp_path / "exported.tif"
+    worker = FileExportWorker(source_file, dest)
+    worker.chunk_size = 1024 * 1024
+    worker.bytes_copied.connect(lambda copied: worker.cancel())
+
+    with qtbot.assertNotEmitted(worker.export_completed), qtbot.assertNotEmitted(worker.export_failed):
+        worker.run()
+
+    assert not dest.exists()
+
+
+"""
+
+    Desc: Test That Exporting A File Onto Itself Fails Without Truncating It
+
+"""
+@pytest.mark.unit
+def test_export_same_file_fails(qtbot, source_file):
+    contents = source_file.read_bytes()
+    worker = FileExportWorker(source_file, source_file)
+
+    with qtbot.waitSignal(worker.export_failed, timeout=10000):
+        worker.run()
+
+    assert source_file.read_bytes() == contents
@@ -99,11 +99,11 @@ def mock_file_system():
 
 
 @pytest.fixture
-def mock_shutil():
-    """Mock shutil for file export testing"""
-    with patch('shutil.copy2') as mock_copy:
-        mock_copy.return_value = None
-        yield mock_copy
+def export_source(tmp_path):
+    """Create a real file for export testing"""
+    source = tmp_path / "result.tif"
+    source.write_bytes(os.urandom(256 * 1024))
+    return source
 
 
 @pytest.fixture
@@ -202,6 +202,11 @@ def viewer(qtbot, mock_file_system):
     return widget
 
 
+def wait_for_render(qtbot, viewer):
+    """Wait for the viewer's background TIF render to finish"""
+    qtbot.waitUntil(lambda: viewer.tif_worker is None, timeout=10000)
+
+
 @pytest.mark.unit
 def test_initialization(viewer):
     """Test proper initialization of the ResultsViewerWidget"""
@@ -231,6 +236,17 @@ def test_initialization(viewer):
     assert hasattr(viewer, 'scale_slider')
 
 
+@pytest.mark.unit
+def test_colormap_luts_precomputed(viewer):
+    """Test that every selectable colormap has a uint8 lookup table built at startup"""
+    items = [viewer.colormap_selector.itemText(i) for i in range(viewer.colormap_selector.count())]
+    assert items == viewer.available_colormaps
+    for name in items:
+        lut = viewer.cmap_luts[name]
+        assert lut.shape == (256, 4)
+        assert lut.dtype == np.uint8
+
+
 @pytest.mark.unit
 def test_update_contour_value(viewer):
     """Test the _update_contour_value method"""
@@ -271,9 +287,9 @@ def test_apply_contour_changes_without_file(viewer, monkeypatch):
 @pytest.mark.unit
 def test_apply_contour_changes_with_tif_file(viewer, monkeypatch):
     """Test the _apply_contour_changes method with a TIF file loaded"""
-    # Setup a spy for _load_tif_file
-    mock_load_tif = MagicMock()
-    monkeypatch.setattr(viewer, '_load_tif_file', mock_load_tif)
+    # Setup a spy for _render_current_tif
+    mock_render_tif = MagicMock()
+    monkeypatch.setattr(viewer, '_render_current_tif', mock_render_tif)
     
     # Set slider value
     viewer.contour_slider.setValue(30)
@@ -286,9 +302,9 @@ def test_apply_contour_changes_with_tif_file(viewer, monkeypatch):
     # Apply changes with a TIF file
     viewer._apply_contour_changes()
     
-    # Check contour_line_count is updated and _load_tif_file is called
+    # Check contour_line_count is updated and the current TIF is re-rendered
     assert viewer.contour_line_count == 30
-    mock_load_tif.assert_called_once_with(mock_file_path)
+    mock_render_tif.assert_called_once_with()
 
 
 @pytest.mark.unit
@@ -934,11 +950,11 @@ def test_on_file_selected_non_tif_file(viewer, mock_file_system, qtbot, monkeypa
 
 
 @pytest.mark.unit
-def test_on_colormap_changed(viewer, monkeypatch):
+def test_on_colormap_changed(viewer, monkeypatch, qtbot):
     """Test _on_colormap_changed method"""
-    # Mock _load_tif_file method
+    # Mock _render_current_tif method
     mock_load = MagicMock()
-    monkeypatch.setattr(viewer, '_load_tif_file', mock_load)
+    monkeypatch.setattr(viewer, '_render_current_tif', mock_load)
     
     # Setup current file
     mock_file = MagicMock()
@@ -948,9 +964,11 @@ def test_on_colormap_changed(viewer, monkeypatch):
     # Change colormap
     viewer._on_colormap_changed('plasma')
     
-    # Check state
+    # Check state (Reload Is Deferred Until The Debounce Timer Fires)
     assert viewer.current_colormap == 'plasma'
-    mock_load.assert_called_once_with(mock_file)
+    mock_load.assert_not_called()
+    qtbot.waitUntil(lambda: mock_load.called, timeout=1000)
+    mock_load.assert_called_once_with()
     
     # Test with no file
     mock_load.reset_mock()
@@ -959,17 +977,80 @@ def test_on_colormap_changed(viewer, monkeypatch):
     
     # Check state
     assert viewer.current_colormap == 'inferno'
+    assert not viewer.reload_timer.isActive()
     mock_load.assert_not_called()
 
 
+@pytest.mark.unit
+def test_on_colormap_changed_debounced(viewer, monkeypatch, qtbot):
+    """Test rapid colormap changes coalesce into a single reload"""
+    mock_load = MagicMock()
+    monkeypatch.setattr(viewer, '_render_current_tif', mock_load)
+
+    mock_file = MagicMock()
+    mock_file.suffix.lower.return_value = '.tif'
+    viewer.current_file_path = mock_file
+
+    # Burst Of Changes
+    for name in ['plasma', 'inferno', 'magma', 'terrain']:
+        viewer._on_colormap_changed(name)
+
+    qtbot.waitUntil(lambda: mock_load.called, timeout=1000)
+    qtbot.wait(250)
+
+    mock_load.assert_called_once_with()
+    assert viewer.current_colormap == 'terrain'
+
+
+@pytest.mark.unit
+def test_rendered_pixmap_keeps_buffer_alive(viewer, qtbot):
+    """Test that the displayed pixmap's backing array is kept on the viewer"""
+    chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+    viewer._load_tif_file(chm_path)
+    wait_for_render(qtbot, viewer)
+
+    pixmap = viewer.tif_image.pixmap()
+    assert viewer.tif_buffer is not None
+    assert (pixmap.height(), pixmap.width()) == viewer.tif_buffer.shape[:2]
+
+
+@pytest.mark.unit
+def test_colormap_change_reuses_decoded_tif(viewer, qtbot, monkeypatch):
+    """Test that re-rendering with a new colormap doesn't reopen the TIF file"""
+    from ResilientGeoDrone.src.front_end import tif_render_worker
+
+    chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+    viewer.current_file_path = chm_path
+    viewer._load_tif_file(chm_path)
+    wait_for_render(qtbot, viewer)
+    assert viewer.current_tif is not None
+
+    # Any Reopen Of The File Would Now Fail
+    mock_open = MagicMock(side_effect=rasterio.errors.RasterioIOError("reopened"))
+    monkeypatch.setattr(tif_render_worker.rasterio, 'open', mock_open)
+
+    viewer.current_colormap = 'plasma'
+    viewer._render_current_tif()
+    wait_for_render(qtbot, viewer)
+
+    mock_open.assert_not_called()
+    assert viewer.file_viewers.currentIndex() == 0
+
+    # Selecting The File Again Reads It Fresh
+    viewer._load_tif_file(chm_path)
+    wait_for_render(qtbot, viewer)
+    mock_open.assert_called_once()
+    assert viewer.current_tif is None
+
 
 @pytest.mark.unit
-def test_load_tif_file_single_band_success(viewer):
+def test_load_tif_file_single_band_success(viewer, qtbot):
   # Grab Test Orthophoto
   chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
 
   # Call Our Method With The Path
   viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
 
   # Check that the TIF file was loaded and displayed
   assert viewer.file_viewers.currentIndex() == 0, \
@@ -981,12 +1062,13 @@ def test_load_tif_file_single_band_success(viewer):
   
 
 @pytest.mark.unit
-def test_load_tif_file_multi_band(viewer):
+def test_load_tif_file_multi_band(viewer, qtbot):
   # Grab Test CHM 
   ortho_path = Path(__file__).parent.parent / "data/utils/test_ortho.tif"
 
   # Call Our Method With The Path
   viewer._load_tif_file(ortho_path)
+  wait_for_render(qtbot, viewer)
 
   # Check that the TIF file was loaded and displayed
   assert viewer.file_viewers.currentIndex() == 0, \
@@ -998,16 +1080,58 @@ def test_load_tif_file_multi_band(viewer):
   
 
 @pytest.mark.unit
-def test_load_tif_file_error(viewer, mock_rasterio_env, mock_rasterio_open):
-    
+def test_load_tif_file_error(viewer, qtbot, mock_rasterio_env, mock_rasterio_open):
+    _, mock_src = mock_rasterio_open
+    mock_src.read.side_effect = rasterio.errors.RasterioIOError("non_existent.tif: No such file or directory")
+
     # Call Method With Non-Existent File
     viewer._load_tif_file(Path("non_existent.tif"))
+    wait_for_render(qtbot, viewer)
     
     # Ensure Our Warnings Were Raised
     assert viewer.empty_state.text().startswith("Error loading TIF file:")
     assert viewer.tif_image.pixmap() is None, "Pixmap should be None on error"
 
 
+@pytest.mark.unit
+def test_load_tif_file_reuses_hillshade(viewer, qtbot):
+  chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+
+  # First Load Computes The Hillshade
+  viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
+  intensity = viewer.hillshade_cache[1]
+
+  # Colormap Change Should Reuse The Same Intensity Array
+  viewer.current_colormap = 'plasma'
+  viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
+  assert viewer.hillshade_cache[1] is intensity
+  assert viewer.file_viewers.currentIndex() == 0
+
+
+@pytest.mark.unit
+def test_load_tif_file_contour_cache(viewer, qtbot):
+  chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+
+  viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
+  mask = viewer.contour_cache[1]
+  assert mask.dtype == np.uint8 and mask.any()
+
+  # Colormap Change Keeps The Cached Mask
+  viewer.current_colormap = 'magma'
+  viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
+  assert viewer.contour_cache[1] is mask
+
+  # Changing The Line Count Rebuilds It
+  viewer.contour_line_count = 12
+  viewer._load_tif_file(chm_path)
+  wait_for_render(qtbot, viewer)
+  assert viewer.contour_cache[1] is not mask
+  assert viewer.contour_cache[0][2] == 12
+
 
 @pytest.mark.unit
 def test_open_external_no_file(viewer):
@@ -1059,52 +1183,58 @@ def test_export_file_no_file(viewer):
 
 
 @pytest.mark.unit
-def test_export_file_cancel(viewer, mock_qfiledialog, mock_shutil, mock_file_system):
+def test_export_file_cancel(viewer, mock_qfiledialog, export_source):
     """Test _export_file with cancel"""
-    _, _, _, _, _, _, mock_tif_file, _ = mock_file_system
-    viewer.current_file_path = mock_tif_file
+    viewer.current_file_path = export_source
     
     mock_qfiledialog.return_value = ("", "")
     
     # Call method
-    viewer._export_file()
+    with patch('ResilientGeoDrone.src.front_end.result_viewer.FileExportWorker') as mock_worker:
+        viewer._export_file()
     
-    # Check no copy was performed
-    mock_shutil.assert_not_called()
+    # Check no copy was started
+    mock_worker.assert_not_called()
+    assert viewer.export_worker is None
 
 
 @pytest.mark.unit
-def test_export_file_success(viewer, mock_qfiledialog, mock_shutil, mock_qmessagebox, mock_file_system):
+def test_export_file_success(viewer, qtbot, tmp_path, mock_qfiledialog, mock_qmessagebox, export_source):
     """Test _export_file success"""
-    _, _, _, _, _, _, mock_tif_file, _ = mock_file_system
-    viewer.current_file_path = mock_tif_file
+    viewer.current_file_path = export_source
+    dest_path = tmp_path / "exported.tif"
+    mock_qfiledialog.return_value = (str(dest_path), "*.tif")
     mock_info, mock_warn = mock_qmessagebox
     
-    # Call method
+    # Call method (Copy Runs On A Worker Thread)
     viewer._export_file()
+    qtbot.waitUntil(lambda: viewer.export_worker is None, timeout=10000)
     
     # Check file was copied and success message shown
-    mock_shutil.assert_called_once_with(mock_tif_file, "/path/to/save/file.tif")
+    assert dest_path.read_bytes() == export_source.read_bytes()
+    assert viewer.export_progress is None
     mock_info.assert_called_once()
     assert "Success" in mock_info.call_args[0][1]
+    mock_warn.assert_not_called()
 
 
 @pytest.mark.unit
-def test_export_file_error(viewer, mock_qfiledialog, mock_shutil, mock_qmessagebox, mock_file_system):
+def test_export_file_error(viewer, qtbot, tmp_path, mock_qfiledialog, mock_qmessagebox, export_source):
     """Test _export_file with error"""
-    _, _, _, _, _, _, mock_tif_file, _ = mock_file_system
-    viewer.current_file_path = mock_tif_file
+    viewer.current_file_path = export_source
     
-    # Setup error
-    mock_shutil.side_effect = Exception("Permission denied")
+    # Setup error (Destination Directory Doesn't Exist)
+    mock_qfiledialog.return_value = (str(tmp_path / "missing" / "exported.tif"), "*.tif")
     mock_info, mock_warn = mock_qmessagebox
     
     # Call method
     viewer._export_file()
+    qtbot.waitUntil(lambda: viewer.export_worker is None, timeout=10000)
     
     # Check warning was shown
     mock_warn.assert_called_once()
     assert "Could not export file" in mock_warn.call_args[0][2]
+    mock_info.assert_not_called()
 
 
 @pytest.mark.unit
@@ -1118,4 +1248,21 @@ def test_go_back_to_pipeline(viewer, monkeypatch):
     viewer._go_back_to_pipeline()
     
     # Check widget was closed
-    mock_close.assert_called_once()
\ No newline at end of file
+    mock_close.assert_called_once()
+
+@pytest.mark.unit
+def test_colorbar_shown_for_height_maps_only(viewer, qtbot):
+    """Test that the colorbar widget is drawn for single-band TIFs and hidden for RGB"""
+    chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+    viewer._load_tif_file(chm_path)
+    wait_for_render(qtbot, viewer)
+
+    assert not viewer.colorbar_label.isHidden()
+    assert not viewer.colorbar_label.pixmap().isNull()
+    assert f"{viewer.current_tif['amax']:.2f}m" in viewer.colorbar_label.toolTip()
+
+    ortho_path = Path(__file__).parent.parent / "data/utils/test_ortho.tif"
+    viewer._load_tif_file(ortho_path)
+    wait_for_render(qtbot, viewer)
+
+    assert viewer.colorbar_label.isHidden()
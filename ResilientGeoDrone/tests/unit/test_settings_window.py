@@ -946,3 +946,194 @@ def test_save_settings_missing_terrain_fields(settings_window, monkeypatch, tmp_
     # Verify geospatial output path was saved
     assert 'output_path' in saved_config['geospatial']
     assert saved_config['geospatial']['output_path'] == settings_window.output_path.text()
+
+
+"""
+
+    Desc: Test That The Parsed Config Is Served From Its Pickled Sidecar
+    While The YAML Is Unchanged, And Re-Parsed Once The YAML Changes
+
+"""
+@pytest.mark.unit
+def test_config_sidecar_cache(qtbot, tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text((Path(__file__).parent.parent.parent / "config/config.yaml").read_text())
+
+    # First Load Parses The YAML And Writes The Sidecar
+    window = SettingsWindow(config_path)
+    qtbot.addWidget(window)
+    assert (tmp_path / "config.yaml.pkl").exists()
+
+    # Second Load (In A Fresh Session) Must Not Touch The YAML Parser
+    monkeypatch.setattr(SettingsWindow, 'config_cache', {})
+    load_mock = MagicMock(side_effect=AssertionError("YAML Should Not Be Parsed"))
+    monkeypatch.setattr('ResilientGeoDrone.src.front_end.settings_window.yaml.load', load_mock)
+    cached_window = SettingsWindow(config_path)
+    qtbot.addWidget(cached_window)
+    assert cached_window.config == window.config
+    load_mock.assert_not_called()
+    monkeypatch.undo()
+
+    # Saving Invalidates The Sidecar And The Next Load Sees The New Values
+    cached_window.width.setValue(cached_window.width.value() + 1)
+    cached_window.save_settings()
+    assert not (tmp_path / "config.yaml.pkl").exists()
+    reloaded_window = SettingsWindow(config_path)
+    qtbot.addWidget(reloaded_window)
+    assert reloaded_window.width.value() == window.width.value() + 1
+
+
+"""
+
+    Desc: Test That Reopening The Settings Window Reuses The Config Parsed
+    By The Previous Window, Handing Each Window Its Own Copy
+
+"""
+@pytest.mark.unit
+def test_config_memoized_across_windows(qtbot, tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text((Path(__file__).parent.parent.parent / "config/config.yaml").read_text())
+
+    window = SettingsWindow(config_path)
+    qtbot.addWidget(window)
+
+    # Neither The Sidecar Nor The YAML Should Be Read Again
+    read_mock = MagicMock(side_effect=AssertionError("Config Should Come From Memory"))
+    monkeypatch.setattr(SettingsWindow, '_read_config_file', read_mock)
+    reopened_window = SettingsWindow(config_path)
+    qtbot.addWidget(reopened_window)
+    read_mock.assert_not_called()
+
+    # Edits In One Window Don't Leak Into The Other
+    assert reopened_window.config == window.config
+    window.config['preprocessing']['max_workers'] += 1
+    assert reopened_window.config != window.config
+
+
+"""
+
+    Desc: Test That Only The Visible Environment Tab Is Built Up Front,
+    The Others Are Built When Selected, And Saving Keeps The Config
+    Values Of Environments That Were Never Opened
+
+"""
+@pytest.mark.unit
+def test_env_tabs_built_lazily(settings_window, tmp_path, monkeypatch):
+    assert list(settings_window.env_widgets) == ['sunny']
+
+    settings_window.env_tabs.setCurrentIndex(2)
+    assert list(settings_window.env_widgets) == ['sunny', 'foggy']
+    assert 'foggy' not in settings_window.env_builders
+
+    # Returning To A Built Tab Doesn't Rebuild It
+    sunny_widgets = settings_window.env_widgets['sunny']
+    settings_window.env_tabs.setCurrentIndex(0)
+    assert settings_window.env_widgets['sunny'] is sunny_widgets
+
+    environments = settings_window.config['point_cloud']['webodm']['environments']
+    night_config = dict(environments['night'])
+
+    settings_window.config_path = tmp_path / "temp_config.yaml"
+    settings_window.save_settings()
+    with open(settings_window.config_path, 'r') as f:
+        saved_config = yaml.safe_load(f)
+    assert saved_config['point_cloud']['webodm']['environments']['night'] == night_config
+
+
+"""
+
+    Desc: Test That The Log List Only Picks Up .log Files, Skipping Other
+    Files And Directories Whose Names End In .log
+
+"""
+@pytest.mark.unit
+def test_refresh_logs_skips_non_log_entries(settings_window, tmp_log_dir, monkeypatch):
+    (tmp_log_dir / "run.log").write_text("x" * 2048)
+    (tmp_log_dir / "notes.txt").write_text("Not A Log")
+    (tmp_log_dir / "archive.log").mkdir()
+
+    monkeypatch.setattr(settings_window, "logs_dir", tmp_log_dir)
+    settings_window.refresh_logs_list()
+
+    assert settings_window.logs_list.count() == 1
+    item = settings_window.logs_list.item(0)
+    assert item.data(Qt.UserRole) == str(tmp_log_dir / "run.log")
+    assert "(2.00 KB)" in item.text()
+
+
+"""
+
+    Desc: Test That Large Logs Only Have Their Tail Displayed, Starting At
+    A Full Line, Until The Load Full Log Button Is Clicked
+
+"""
+@pytest.mark.unit
+def test_display_log_content_tail(settings_window, tmp_log_dir, monkeypatch, qtbot):
+    monkeypatch.setattr(SettingsWindow, "log_tail_bytes", 1024)
+    lines = [f"Line {i:04d}" for i in range(500)]
+    (tmp_log_dir / "big.log").write_text("\n".join(lines))
+
+    monkeypatch.setattr(settings_window, "logs_dir", tmp_log_dir)
+    settings_window.refresh_logs_list()
+    settings_window.logs_list.setCurrentRow(0)
+
+    # Only Whole Lines From The Tail Are Shown, Behind A Truncation Banner
+    shown = settings_window.log_content.toPlainText().split("\n")
+    assert "Truncated" in shown[0]
+    assert shown[-1] == lines[-1]
+    assert shown[1] in lines and len(shown) - 1 < len(lines)
+    assert settings_window.load_full_btn.isEnabled()
+
+    qtbot.mouseClick(settings_window.load_full_btn, Qt.LeftButton)
+    assert settings_window.log_content.toPlainText() == "\n".join(lines)
+    assert not settings_window.load_full_btn.isEnabled()
+
+
+"""
+
+    Desc: Test That Saving Without Any Changes Doesn't Rewrite The Config,
+    While Saving After A Change Does
+
+"""
+@pytest.mark.unit
+def test_save_settings_skips_unchanged(settings_window, tmp_path, monkeypatch):
+    settings_window.config_path = tmp_path / "temp_config.yaml"
+    settings_window.save_settings()
+    assert settings_window.config_path.exists()
+
+    dump_mock = MagicMock()
+    monkeypatch.setattr('ResilientGeoDrone.src.front_end.settings_window.yaml.dump', dump_mock)
+    information_mock = MagicMock()
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.information', information_mock)
+
+    # Nothing Changed Since The Last Save
+    settings_window.save_settings(silent=False)
+    dump_mock.assert_not_called()
+    information_mock.assert_called_once()
+
+    settings_window.blur.setValue(settings_window.blur.value() + 1)
+    settings_window.save_settings()
+    dump_mock.assert_called_once()
+
+
+"""
+
+    Desc: Test That A Failed Save Leaves The Existing Config File Intact
+
+"""
+@pytest.mark.unit
+def test_save_settings_atomic(settings_window, tmp_path, monkeypatch):
+    config_path = tmp_path / "temp_config.yaml"
+    config_path.write_text("original: true\n")
+    settings_window.config_path = config_path
+
+    def failing_replace(*args, **kwargs):
+        raise OSError("Disk Full")
+    monkeypatch.setattr('ResilientGeoDrone.src.front_end.settings_window.os.replace', failing_replace)
+    critical_mock = MagicMock()
+    monkeypatch.setattr('PyQt5.QtWidgets.QMessageBox.critical', critical_mock)
+
+    settings_window.save_settings()
+
+    critical_mock.assert_called_once()
+    assert config_path.read_text() == "original: true\n"
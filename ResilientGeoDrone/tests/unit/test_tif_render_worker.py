@@ -0,0 +1,219 @@
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import numpy as np
+import matplotlib.pyplot as plt
+
+from ResilientGeoDrone.src.front_end.tif_render_worker import TifRenderWorker
+
+
+"""
+
+    Desc: Fixture For Setting Up A Render Worker For Our Test CHM
+
+"""
+@pytest.fixture
+def chm_worker(qtbot):
+    chm_path = Path(__file__).parent.parent / "data/utils/test_chm.tif"
+    return TifRenderWorker(1, chm_path, 'viridis', 5, True, 1.0)
+
+
+"""
+
+    Desc: Test That A Single-Band Render Emits An RGBA Image And Populates Our Caches
+
+"""
+@pytest.mark.unit
+def test_render_single_band(chm_worker, qtbot):
+    with qtbot.waitSignal(chm_worker.render_completed, timeout=10000) as blocker:
+        chm_worker.start()
+    chm_worker.wait()
+
+    generation, image, info = blocker.args
+    assert generation == 1
+    assert image.dtype == np.uint8 and image.shape[2] == 4
+    assert "test_chm.tif" in info
+    assert chm_worker.hillshade_cache is not None
+    assert chm_worker.contour_cache[0][2] == 5
+
+
+"""
+
+    Desc: Test That Canceled Workers Don't Emit Any Results
+
+"""
+@pytest.mark.unit
+def test_render_canceled(chm_worker, qtbot):
+    chm_worker.cancel()
+    with qtbot.assertNotEmitted(chm_worker.render_completed), qtbot.assertNotEmitted(chm_worker.render_failed):
+        chm_worker.run()
+
+
+"""
+
+    Desc: Test That Failed Renders Emit The Error Message
+
+"""
+@pytest.mark.unit
+def test_render_failed(qtbot):
+    worker = TifRenderWorker(3, Path("non_existent.tif"), 'viridis', 5, True, 1.0)
+    with qtbot.waitSignal(worker.render_failed, timeout=10000) as blocker:
+        worker.run()
+
+    assert blocker.args[0] == 3
+    assert blocker.args[1]
+
+
+"""
+
+    Desc: Test That Our Colormap Blend Makes NoData Pixels Transparent
+
+"""
+@pytest.mark.unit
+def test_blend_colormap_nodata_transparent(chm_worker):
+    data = np.array([[0.0, 1.0], [np.nan, 2.0]], dtype=np.float32)
+    intensity = np.full(data.shape, 0.5, dtype=np.float32)
+    lut = (plt.get_cmap('viridis')(np.linspace(0, 1, 256)) * 255).astype(np.uint8)
+
+    rgba = chm_worker._blend_colormap(data, intensity, lut, 0.0, 2.0)
+
+    assert rgba.shape == (2, 2, 4) and rgba.dtype == np.uint8
+    assert rgba[1, 0, 3] == 0
+    assert rgba[0, 0, 3] == 255
+
+
+"""
+
+    Desc: Test That Downscaled Rasters With Overviews Use A Decimated Read Instead Of cv2.resize
+
+"""
+@pytest.mark.unit
+def test_render_large_raster_uses_overviews(qtbot, tmp_path, monkeypatch):
+    import rasterio
+    from rasterio.enums import Resampling
+    from ResilientGeoDrone.src.front_end import tif_render_worker
+
+    # Build A Single-Band Raster With Overviews
+    dsm_path = tmp_path / "dsm.tif"
+    size = 2100
+    data = np.tile(np.linspace(0, 50, size, dtype=np.float32), (size, 1))
+    with rasterio.open(dsm_path, 'w', driver='GTiff', height=size, width=size, count=1,
+                       dtype='float32', nodata=-9999.0, tiled=True) as dst:
+        dst.write(data, 1)
+        dst.build_overviews([2, 4], Resampling.average)
+
+    # cv2.resize Should Never Be Reached
+    resize = MagicMock(side_effect=AssertionError("cv2.resize called"))
+    monkeypatch.setattr(tif_render_worker.cv2, 'resize', resize)
+
+    worker = TifRenderWorker(1, dsm_path, 'viridis', 0, False, 0.5)
+    with qtbot.waitSignal(worker.render_completed, timeout=30000) as blocker:
+        worker.run()
+
+    resize.assert_not_called()
+    assert worker.hillshade_cache[0][1] == (size // 2, size // 2)
+
+
+"""
+
+    Desc: Test That Quantized Contour Tracing Draws No Outline Around NoData
+
+"""
+@pytest.mark.unit
+def test_build_contour_mask_ignores_nodata(chm_worker):
+    data = np.tile(np.linspace(0, 10, 200, dtype=np.float32), (200, 1))
+    data[:, :50] = np.nan
+
+    mask = chm_worker._build_contour_mask(data, 0.0, 10.0)
+
+    assert mask.dtype == np.uint8 and mask.shape == data.shape
+    assert mask[:, :55].max() == 0
+    assert mask[:, 55:].max() > 0
+
+
+"""
+
+    Desc: Test That Our float32 Hillshade Matches Matplotlib's LightSource
+
+"""
+@pytest.mark.unit
+def test_compute_hillshade_matches_lightsource(chm_worker):
+    from matplotlib.colors import LightSource
+
+    rng = np.random.default_rng(0)
+    data = rng.random((64, 80), dtype=np.float32) * 20
+    data[10:14, 20:30] = np.nan
+
+    intensity = chm_worker._compute_hillshade(data, azdeg=315, altdeg=35, vert_exag=3)
+    expected = LightSource(azdeg=315, altdeg=35).hillshade(data, vert_exag=3)
+
+    assert intensity.dtype == np.float32
+    np.testing.assert_allclose(intensity, expected, atol=1e-5)
+
+
+"""
+
+    Desc: Test That Our Slice-Based Derivative Matches np.gradient Along Both Axes
+
+"""
+@pytest.mark.unit
+def test_central_difference_matches_gradient(chm_worker):
+    rng = np.random.default_rng(1)
+    data = rng.random((30, 45), dtype=np.float32)
+
+    expected_dy, expected_dx = np.gradient(data, -0.5, 0.25)
+    dy = chm_worker._central_difference(data, -0.5)
+    dx = chm_worker._central_difference(data.T, 0.25).T
+
+    assert dy.dtype == np.float32 and dx.flags['C_CONTIGUOUS']
+    np.testing.assert_allclose(dy, expected_dy, rtol=1e-5)
+    np.testing.assert_allclose(dx, expected_dx, rtol=1e-5)
+
+
+"""
+
+    Desc: Test That Renders Alternate Between Two Recycled RGBA Buffers, So
+    A Render Never Writes Into The Image Currently Being Displayed
+
+"""
+@pytest.mark.unit
+def test_render_recycles_scratch_buffers(chm_worker, qtbot):
+    images = []
+    current_tif, scratch = None, None
+    for generation, colormap in enumerate(['viridis', 'plasma', 'magma']):
+        worker = TifRenderWorker(generation, chm_worker.file_path, colormap, 5, True, 1.0,
+                                 current_tif=current_tif, scratch=scratch)
+        with qtbot.waitSignal(worker.render_completed, timeout=10000) as blocker:
+            worker.run()
+        images.append(blocker.args[1])
+        current_tif, scratch = worker.current_tif, worker.scratch
+
+    assert not np.shares_memory(images[0], images[1])
+    assert not np.shares_memory(images[1], images[2])
+    assert np.shares_memory(images[0], images[2])
+
+
+"""
+
+    Desc: Test That A Dataset Mask Band Marks Invalid Pixels As NaN
+
+"""
+@pytest.mark.unit
+def test_read_band_uses_dataset_mask(chm_worker, tmp_path):
+    import rasterio
+
+    masked_path = tmp_path / "masked.tif"
+    mask = np.full((40, 60), 255, dtype=np.uint8)
+    mask[:10] = 0
+    with rasterio.Env(GDAL_TIFF_INTERNAL_MASK=True):
+        with rasterio.open(masked_path, 'w', driver='GTiff', height=40, width=60, count=1,
+                           dtype='float32') as dst:
+            dst.write(np.ones((40, 60), dtype=np.float32), 1)
+            dst.write_mask(mask)
+
+    with rasterio.open(masked_path) as src:
+        full = chm_worker._read_band(src)
+        decimated = chm_worker._read_band(src, out_shape=(20, 30))
+
+    assert np.isnan(full[:10]).all() and not np.isnan(full[10:]).any()
+    assert np.isnan(decimated[:5]).all() and not np.isnan(decimated[5:]).any()